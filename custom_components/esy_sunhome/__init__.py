@@ -4,7 +4,8 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DOMAIN,
@@ -118,8 +119,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     tp_type = entry.data.get(CONF_TP_TYPE, DEFAULT_TP_TYPE)
     mcu_version = entry.data.get(CONF_MCU_VERSION, DEFAULT_MCU_VERSION)
 
-    # Create API instance
-    api = ESYSunhomeAPI(username, password, device_id)
+    @callback
+    def _store_device_id(resolved_id: str) -> None:
+        """Persist a looked-up device ID so later starts skip the lookup."""
+        if entry.data.get(CONF_DEVICE_ID) != resolved_id:
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_DEVICE_ID: resolved_id}
+            )
+
+    # Create API instance on HA's shared client session (keep-alive pool)
+    api = ESYSunhomeAPI(
+        username,
+        password,
+        device_id,
+        session=async_get_clientsession(hass),
+        on_device_id_resolved=_store_device_id,
+    )
 
     protocol = None
     try:
@@ -168,7 +183,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
 
         # Load protocol definition from API
-        protocol_api = get_protocol_api(api.access_token)
+        protocol_api = get_protocol_api(
+            api.access_token, session=async_get_clientsession(hass)
+        )
         protocol = await protocol_api.get_protocol_definition(
             pv_power=pv_power,
             tp_type=tp_type,
@@ -5,7 +5,6 @@ API calls still used for mode changes and triggering updates.
 """
 
 import asyncio
-import contextlib
 import json
 import logging
 from typing import Any, Optional
@@ -107,6 +106,30 @@ class BatteryState:
         3: "Electricity Sell Mode",
     }
 
+    # Legacy attribute name -> parsed telemetry key
+    legacy_map = {
+        ATTR_SOC: "batterySoc",
+        ATTR_GRID_POWER: "gridPower",
+        ATTR_LOAD_POWER: "loadPower",
+        ATTR_BATTERY_POWER: "batteryPower",
+        ATTR_PV_POWER: "pvPower",
+        ATTR_BATTERY_IMPORT: "batteryImport",
+        ATTR_BATTERY_EXPORT: "batteryExport",
+        ATTR_GRID_IMPORT: "gridImport",
+        ATTR_GRID_EXPORT: "gridExport",
+        ATTR_GRID_ACTIVE: "gridLine",
+        ATTR_LOAD_ACTIVE: "loadLine",
+        ATTR_PV_ACTIVE: "pvLine",
+        ATTR_BATTERY_ACTIVE: "batteryLine",
+        ATTR_HEATER_STATE: "heatingState",
+        ATTR_BATTERY_STATUS: "batteryStatus",
+        ATTR_SYSTEM_RUN_STATUS: "systemRunStatus",
+        ATTR_DAILY_POWER_GEN: "dailyPowerGeneration",
+        ATTR_RATED_POWER: "ratedPower",
+        ATTR_INVERTER_TEMP: "inverterTemp",
+        ATTR_BATTERY_STATUS_TEXT: "batteryStatusText",
+    }
+
     def __init__(self, data: dict) -> None:
         """Initialize with parsed telemetry data."""
         self.data = data
@@ -127,30 +150,7 @@ class BatteryState:
                 return self.data[name]
             
             # Legacy attribute name mappings
-            legacy_map = {
-                ATTR_SOC: "batterySoc",
-                ATTR_GRID_POWER: "gridPower",
-                ATTR_LOAD_POWER: "loadPower",
-                ATTR_BATTERY_POWER: "batteryPower",
-                ATTR_PV_POWER: "pvPower",
-                ATTR_BATTERY_IMPORT: "batteryImport",
-                ATTR_BATTERY_EXPORT: "batteryExport",
-                ATTR_GRID_IMPORT: "gridImport",
-                ATTR_GRID_EXPORT: "gridExport",
-                ATTR_GRID_ACTIVE: "gridLine",
-                ATTR_LOAD_ACTIVE: "loadLine",
-                ATTR_PV_ACTIVE: "pvLine",
-                ATTR_BATTERY_ACTIVE: "batteryLine",
-                ATTR_HEATER_STATE: "heatingState",
-                ATTR_BATTERY_STATUS: "batteryStatus",
-                ATTR_SYSTEM_RUN_STATUS: "systemRunStatus",
-                ATTR_DAILY_POWER_GEN: "dailyPowerGeneration",
-                ATTR_RATED_POWER: "ratedPower",
-                ATTR_INVERTER_TEMP: "inverterTemp",
-                ATTR_BATTERY_STATUS_TEXT: "batteryStatusText",
-            }
-            
-            mapped_key = legacy_map.get(name, name)
+            mapped_key = self.legacy_map.get(name, name)
             if mapped_key in self.data:
                 return self.data[mapped_key]
             
@@ -264,6 +264,8 @@ class EsySunhomeBattery:
             _LOGGER.debug("Listener cancelled")
         self._listener_task = None
         self._client = None
+        if self.api:
+            await self.api.close_session()
 
     def _process_message(self, message, listener: MessageListener):
         """Process incoming binary MQTT message."""
@@ -271,10 +273,12 @@ class EsySunhomeBattery:
             payload = message.payload
             topic = str(message.topic)
             
-            _LOGGER.debug("MQTT message received on %s (%d bytes)", topic, len(payload))
-            _LOGGER.debug("=== MQTT TELEMETRY RECEIVED ===")
-            _LOGGER.debug("Payload length: %d bytes", len(payload))
-            _LOGGER.debug("Payload (hex): %s...", payload[:100].hex())
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug("MQTT message received on %s (%d bytes)", topic, len(payload))
+                _LOGGER.debug("=== MQTT TELEMETRY RECEIVED ===")
+                _LOGGER.debug("Payload length: %d bytes", len(payload))
+                _LOGGER.debug("Payload (hex): %s...", payload[:100].hex())
             
             # Parse binary payload
             data = self.parser.parse_message(payload)
@@ -284,19 +288,20 @@ class EsySunhomeBattery:
                 self._last_state = state
                 
                 # Log summary
-                _LOGGER.debug("=== PARSED TELEMETRY SUMMARY ===")
-                _LOGGER.debug("  PV1 Power: %sW", data.get("pv1Power", "N/A"))
-                _LOGGER.debug("  PV2 Power: %sW", data.get("pv2Power", "N/A"))
-                _LOGGER.debug("  Battery SOC: %s%%", data.get("batterySoc", "N/A"))
-                _LOGGER.debug("  Battery Power: %sW", data.get("batteryPower", "N/A"))
-                _LOGGER.debug("  Battery Voltage: %sV", data.get("batteryVoltage", "N/A"))
-                _LOGGER.debug("  Battery Current: %sA", data.get("batteryCurrent", "N/A"))
-                _LOGGER.debug("  Grid Power: %sW", data.get("gridPower", "N/A"))
-                _LOGGER.debug("  Load Power: %sW", data.get("loadPower", "N/A"))
-                _LOGGER.debug("  Inverter Temp: %s°C", data.get("inverterTemp", "N/A"))
-                _LOGGER.debug("  Daily Generation: %skWh", data.get("dailyPowerGeneration", "N/A"))
-                _LOGGER.debug("  Grid Mode: %s", data.get("onOffGridMode", "N/A"))
-                _LOGGER.debug("================================")
+                if debug:
+                    _LOGGER.debug("=== PARSED TELEMETRY SUMMARY ===")
+                    _LOGGER.debug("  PV1 Power: %sW", data.get("pv1Power", "N/A"))
+                    _LOGGER.debug("  PV2 Power: %sW", data.get("pv2Power", "N/A"))
+                    _LOGGER.debug("  Battery SOC: %s%%", data.get("batterySoc", "N/A"))
+                    _LOGGER.debug("  Battery Power: %sW", data.get("batteryPower", "N/A"))
+                    _LOGGER.debug("  Battery Voltage: %sV", data.get("batteryVoltage", "N/A"))
+                    _LOGGER.debug("  Battery Current: %sA", data.get("batteryCurrent", "N/A"))
+                    _LOGGER.debug("  Grid Power: %sW", data.get("gridPower", "N/A"))
+                    _LOGGER.debug("  Load Power: %sW", data.get("loadPower", "N/A"))
+                    _LOGGER.debug("  Inverter Temp: %s°C", data.get("inverterTemp", "N/A"))
+                    _LOGGER.debug("  Daily Generation: %skWh", data.get("dailyPowerGeneration", "N/A"))
+                    _LOGGER.debug("  Grid Mode: %s", data.get("onOffGridMode", "N/A"))
+                    _LOGGER.debug("================================")
                 
                 listener.on_message(state)
             else:
@@ -43,15 +43,25 @@ class EsyBinarySensorBase(EsySunhomeEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.POWER
     _attr_is_on = False
+    # (is_on, available) as of the last state write
+    _last_written: tuple | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        if hasattr(self.coordinator.data, self._attr_translation_key):
-            # Values: 0=inactive, 1=flow direction A, 2=flow direction B
-            # Consider active if value is non-zero
-            value = getattr(self.coordinator.data, self._attr_translation_key)
-            self._attr_is_on = value is not None and value != 0
-            self.async_write_ha_state()
+        data = self.coordinator.data
+        if not data:
+            return
+        # Values: 0=inactive, 1=flow direction A, 2=flow direction B
+        # Consider active if value is non-zero
+        value = data.get(self._attr_translation_key)
+        self._attr_is_on = value is not None and value != 0
+
+        # Line flags rarely change; skip the state write when nothing did
+        written = (self._attr_is_on, self.available)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
 
 class GridActiveSensor(EsyBinarySensorBase):
@@ -1,12 +1,12 @@
 """Config flow for ESY Sunhome integration."""
 
 import logging
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .esysunhome import ESYSunhomeAPI
 from .const import (
@@ -24,53 +24,22 @@ from .const import (
     DEFAULT_MODE_CHANGE_METHOD,
     MODE_CHANGE_API,
     MODE_CHANGE_MQTT,
-    ESY_API_BASE_URL,
-    ESY_API_DEVICE_ENDPOINT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def fetch_devices(username: str, password: str) -> list:
+async def fetch_devices(api: ESYSunhomeAPI) -> list:
     """Fetch available devices/inverters with detailed info."""
-    api = ESYSunhomeAPI(username, password, "")
-    try:
-        await api.get_bearer_token()
-        
-        # Fetch device list with more details
-        url = f"{ESY_API_BASE_URL}{ESY_API_DEVICE_ENDPOINT}"
-        headers = {"Authorization": f"bearer {api.access_token}"}
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    devices = data.get("data", {}).get("records", [])
-                    _LOGGER.debug("Found %d devices", len(devices))
-                    return devices
-                else:
-                    raise Exception(f"Failed to fetch devices: HTTP {response.status}")
-    finally:
-        await api.close_session()
+    return await api.get_devices()
 
 
 async def fetch_device_details(api: ESYSunhomeAPI, device_id: str) -> dict:
     """Fetch detailed device information including protocol parameters."""
-    url = f"{ESY_API_BASE_URL}/api/lsydevice/detail?deviceId={device_id}"
-    headers = {"Authorization": f"bearer {api.access_token}"}
-    
-    session = None
     try:
-        session = aiohttp.ClientSession()
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data.get("data", {})
+        return await api.get_device_detail(device_id)
     except Exception as e:
         _LOGGER.warning("Failed to fetch device details: %s", e)
-    finally:
-        if session:
-            await session.close()
     
     return {}
 
@@ -117,10 +86,15 @@ class ESYSunhomeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             self.password = user_input["password"]
 
             try:
-                self.api = ESYSunhomeAPI(self.username, self.password, "")
+                self.api = ESYSunhomeAPI(
+                    self.username,
+                    self.password,
+                    "",
+                    session=async_get_clientsession(self.hass),
+                )
                 await self.api.get_bearer_token()
                 
-                self.devices = await fetch_devices(self.username, self.password)
+                self.devices = await fetch_devices(self.api)
                 
                 if not self.devices:
                     _LOGGER.error("No devices found for this account")
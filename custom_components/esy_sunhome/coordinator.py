@@ -10,10 +10,12 @@ from typing import Any, Optional
 import aiomqtt
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
+    CONF_DEVICE_ID,
     ESY_MQTT_BROKER_URL,
     ESY_MQTT_BROKER_PORT,
     ESY_MQTT_USERNAME,
@@ -31,16 +33,25 @@ _LOGGER = logging.getLogger(__name__)
 
 MQTT_RECONNECT_INTERVAL = 30
 POLL_INTERVAL = timedelta(seconds=15)
+BEM_CHECK_PERIOD = timedelta(minutes=3)
+# With polling disabled a tick only services the BEM check, so don't wake
+# any more often than that check is due
+SLOW_POLL_INTERVAL = BEM_CHECK_PERIOD
+# Coalesce bursts of MQTT frames into one listener fan-out
+TELEMETRY_DEBOUNCE = 0.1
 
 
 class TelemetryData:
-    """Container for telemetry data with attribute access."""
+    """Container for telemetry data with attribute access.
+
+    Attributes resolve through ``__getattr__`` against the wrapped dict, so
+    no per-key instance attributes are created for each frame.
+    """
+
+    __slots__ = ("_data",)
     
     def __init__(self, data: dict):
         self._data = data
-        for key, value in data.items():
-            if not key.startswith("_"):
-                setattr(self, key, value)
     
     def get(self, key: str, default: Any = None) -> Any:
         return self._data.get(key, default)
@@ -75,6 +86,13 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         self.device_sn = device_sn
         self.config_entry = config_entry
         self.protocol = protocol
+
+        # Shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.data[CONF_DEVICE_ID])},
+            manufacturer="EsySunhome",
+            model="HM6",
+        )
         
         # Create parser with protocol
         self.parser = create_parser(protocol)
@@ -101,9 +119,12 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         
         # Data state
         self._last_data: dict = {}
+        self._last_wrapper: Optional[TelemetryData] = None  # Shared by all entities
         self._last_raw_values: dict = {}  # For diagnostics
         self._last_mqtt_time: Optional[str] = None  # For diagnostics
-        self._poll_msg_id: int = 0  # Incrementing message ID for poll requests
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._poll_msg_id: int = 0  # Incrementing message ID for poll requests (wraps at 16 bits)
+        self._request_inflight: bool = False  # API update request in progress
 
         # BEM (Battery Energy Management) state — tracked via API
         # BEM is a server-side scheduling feature, not visible on MQTT register 5
@@ -127,6 +148,11 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         # Segment 6: Inverter/CT data
         self._poll_segments = [0, 1, 3, 6]
         
+        self._polling_enabled: bool = config_entry.options.get(
+            CONF_ENABLE_POLLING, DEFAULT_ENABLE_POLLING
+        )
+        self.set_update_interval(self._polling_enabled)
+
         _LOGGER.info("Coordinator initialized for device %s", device_sn)
         _LOGGER.info("MQTT topics: UP=%s, EVENT=%s, DOWN=%s", 
                     self._topic_up, self._topic_event, self._topic_down)
@@ -136,18 +162,27 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         enable_polling = self.config_entry.options.get(
             CONF_ENABLE_POLLING, DEFAULT_ENABLE_POLLING
         )
+        if enable_polling != self._polling_enabled:
+            # Changed from the options flow rather than the switch
+            self.set_polling_enabled(enable_polling)
         
         if enable_polling:
             if self._mqtt_connected:
                 # Send MQTT poll request (like the app does)
                 await self._send_poll_request()
+            elif self._request_inflight:
+                # A slow API call (retries/backoff) is still running; don't stack another
+                _LOGGER.debug("Previous API update request still in flight, skipping")
             else:
                 # Fallback to API if MQTT not connected
+                self._request_inflight = True
                 try:
                     await self.api.request_update()
                     _LOGGER.debug("Requested data update from API (MQTT not connected)")
                 except Exception as e:
                     _LOGGER.warning("Failed to request update from API: %s", e)
+                finally:
+                    self._request_inflight = False
         
         # Periodically check BEM state via API
         self._bem_check_counter += 1
@@ -156,7 +191,7 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
             await self._check_bem_state()
 
         # Return cached data
-        return TelemetryData(self._last_data)
+        return self._last_wrapper or TelemetryData({})
     
     async def _send_poll_request(self) -> bool:
         """Send MQTT poll request for segments (like the app does).
@@ -169,7 +204,7 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         if not self._mqtt_client or not self._mqtt_connected:
             return False
         
-        self._poll_msg_id += 1
+        self._poll_msg_id = (self._poll_msg_id + 1) & 0xFFFF
         
         command = ESYCommandBuilder.build_poll_request(
             segment_ids=self._poll_segments,
@@ -223,6 +258,10 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         """Shutdown coordinator."""
         _LOGGER.info("Shutting down coordinator")
         self._shutdown = True
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         
         if self._mqtt_task:
             self._mqtt_task.cancel()
@@ -391,24 +430,39 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
                 # Merge new data with existing data (preserve fields not in this update)
                 # This prevents brief "unknown" states when partial messages arrive
                 self._last_data.update(data)
-                # Store raw values for diagnostics
-                self._last_raw_values = dict(self._last_data)
                 self._last_mqtt_time = datetime.now().isoformat()
+
+                # Frames often arrive in bursts (UP + EVENT, multi-segment
+                # replies); notify listeners once per burst.
+                if self._flush_handle is None:
+                    self._flush_handle = self.hass.loop.call_later(
+                        TELEMETRY_DEBOUNCE, self._flush_telemetry
+                    )
                 
-                self.async_set_updated_data(TelemetryData(self._last_data))
-                
-                _LOGGER.debug("Updated telemetry: PV=%dW, Grid=%dW, Batt=%dW, Load=%dW, SOC=%d%%",
-                             data.get("pvPower", 0),
-                             data.get("gridPower", 0),
-                             data.get("batteryPower", 0),
-                             data.get("loadPower", 0),
-                             data.get("batterySoc", 0))
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Updated telemetry: PV=%dW, Grid=%dW, Batt=%dW, Load=%dW, SOC=%d%%",
+                                 data.get("pvPower", 0),
+                                 data.get("gridPower", 0),
+                                 data.get("batteryPower", 0),
+                                 data.get("loadPower", 0),
+                                 data.get("batterySoc", 0))
             else:
                 _LOGGER.warning("Failed to parse telemetry")
                 
         except Exception as e:
             _LOGGER.error("Error processing telemetry: %s", e)
 
+    def _flush_telemetry(self) -> None:
+        """Publish the merged telemetry to listeners."""
+        self._flush_handle = None
+        if self._shutdown:
+            return
+        # One snapshot serves both listeners and diagnostics
+        snapshot = dict(self._last_data)
+        self._last_raw_values = snapshot
+        self._last_wrapper = TelemetryData(snapshot)
+        self.async_set_updated_data(self._last_wrapper)
+
     async def _process_alarm(self, payload: bytes) -> None:
         """Process alarm message."""
         _LOGGER.info("Received alarm message (%d bytes)", len(payload))
@@ -427,7 +481,7 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("Cannot publish command: MQTT not connected")
             return False
         
-        topic_down = f"/ESY/PVVC/{self.device_sn}/DOWN"
+        topic_down = self._topic_down
         
         try:
             await self._mqtt_client.publish(topic_down, command)
@@ -519,7 +573,7 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         """
         from .protocol import ESYCommandBuilder
         
-        self._poll_msg_id += 1
+        self._poll_msg_id = (self._poll_msg_id + 1) & 0xFFFF
         
         # Get config_id from protocol if available
         config_id = self.protocol.config_id if self.protocol else 0
@@ -546,7 +600,7 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         """
         from .protocol import ESYCommandBuilder
         
-        self._poll_msg_id += 1
+        self._poll_msg_id = (self._poll_msg_id + 1) & 0xFFFF
         
         # Get config_id from protocol if available
         config_id = self.protocol.config_id if self.protocol else 0
@@ -566,15 +620,37 @@ class ESYSunhomeCoordinator(DataUpdateCoordinator):
         self.parser.set_protocol(protocol)
         _LOGGER.info("Protocol definition updated")
     
+    def set_update_interval(self, fast: bool) -> None:
+        """Use the 15s poll interval when polling, a slower one otherwise.
+
+        The BEM check counter is rescaled so the API is still queried roughly
+        every three minutes regardless of the tick length.
+        """
+        interval = POLL_INTERVAL if fast else SLOW_POLL_INTERVAL
+        if self.update_interval == interval:
+            return
+        self.update_interval = interval
+        self._bem_check_interval = max(
+            1, int(BEM_CHECK_PERIOD.total_seconds() // interval.total_seconds())
+        )
+        _LOGGER.debug("Update interval set to %s", interval)
+
     def set_polling_enabled(self, enabled: bool) -> None:
         """Set polling enabled state.
         
         This is called by the polling switch. The actual state is stored
         in config_entry.options, this method just logs the change and
-        optionally triggers an immediate poll.
+        optionally triggers an immediate poll. Repeated calls with the
+        current state are ignored.
         """
+        if enabled == self._polling_enabled:
+            return
+        self._polling_enabled = enabled
+
         _LOGGER.info("Polling %s", "enabled" if enabled else "disabled")
+        self.set_update_interval(enabled)
         
-        # If enabling polling and MQTT is connected, send an immediate poll
-        if enabled and self._mqtt_connected:
-            asyncio.create_task(self._send_poll_request())
+        # Poll straight away rather than waiting a full interval. A refresh
+        # covers both the MQTT poll and the API fallback when MQTT is down.
+        if enabled and not self._shutdown:
+            self.hass.async_create_task(self.async_request_refresh())
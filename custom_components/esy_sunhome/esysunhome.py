@@ -1,12 +1,15 @@
 import asyncio
+import json
 import logging
 import aiohttp
 import ssl
 import tempfile
+import time
 import os
 from functools import wraps
 from typing import Optional, Callable, Any, Dict
 from dataclasses import dataclass
+from homeassistant.util.json import json_loads
 from .const import (
     ESY_API_BASE_URL,
     ESY_API_LOGIN_ENDPOINT,
@@ -19,10 +22,14 @@ from .const import (
     ESY_API_CERT_ENDPOINT,
     ATTR_SCHEDULE_MODE
 )
-from datetime import datetime, timedelta
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound every API call so a wedged request cannot hold a task forever
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 @dataclass
 class MqttCredentials:
@@ -47,11 +54,46 @@ class TokenExpiredError(Exception):
     pass
 
 
+class ESYApiError(Exception):
+    """Raised when the API rejects a request or returns an error response.
+
+    ``status`` carries the HTTP status when the request itself failed, and
+    is None for application-level errors in a 200 response.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# Failures worth retrying: transport problems and server-side rejections.
+# Programming errors (KeyError etc.) and bad credentials are not retried.
+RETRYABLE_EXCEPTIONS = (aiohttp.ClientError, asyncio.TimeoutError, ESYApiError)
+
+# Client errors that can succeed on a retry; other 4xx responses are final
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+
+def _is_permanent_failure(err: Exception) -> bool:
+    """Return True if retrying the request cannot change the outcome."""
+    if isinstance(err, ESYApiError):
+        status = err.status
+    elif isinstance(err, aiohttp.ClientResponseError):
+        status = err.status
+    else:
+        return False
+    return (
+        status is not None
+        and 400 <= status < 500
+        and status not in RETRYABLE_CLIENT_STATUSES
+    )
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = RETRYABLE_EXCEPTIONS
 ):
     """Decorator that retries a function with exponential backoff.
     
@@ -72,6 +114,8 @@ def retry_with_backoff(
                     return await func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
+                    if _is_permanent_failure(e):
+                        raise
                     if attempt < max_retries:
                         _LOGGER.warning(
                             f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
@@ -91,25 +135,97 @@ def retry_with_backoff(
 
 
 class ESYSunhomeAPI:
-    def __init__(self, username, password, device_id) -> None:
-        """Initialize with user credentials."""
+    def __init__(
+        self,
+        username,
+        password,
+        device_id,
+        session: Optional[aiohttp.ClientSession] = None,
+        on_device_id_resolved: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Initialize with user credentials.
+
+        If a session is given (e.g. Home Assistant's shared client session) it
+        is reused for every request and never closed by this class, so all
+        API instances share one keep-alive connection pool.
+
+        on_device_id_resolved is called with the device ID whenever it has to
+        be looked up from the API, so the caller can persist it and skip the
+        lookup on the next start.
+        """
         self.username = username
         self.password = password
         self.access_token = None
         self.refresh_token = None
-        self.token_expiry = None
+        # time.monotonic() value after which the token is treated as expired
+        self._expiry_monotonic = 0.0
         self.device_id = device_id
+        self._on_device_id_resolved = on_device_id_resolved
         self.name = None
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+
+        # Request URLs and auth headers are assembled once, not per call
+        self._login_url = f"{ESY_API_BASE_URL}{ESY_API_LOGIN_ENDPOINT}"
+        self._refresh_url = f"{ESY_API_BASE_URL}/token"
+        self._device_url = f"{ESY_API_BASE_URL}{ESY_API_DEVICE_ENDPOINT}"
+        self._mode_url = f"{ESY_API_BASE_URL}{ESY_API_MODE_ENDPOINT}"
+        self._schedule_save_url = f"{ESY_API_BASE_URL}{ESY_API_SOCSCHEDULES_SAVE_ENDPOINT}"
+        self._cert_url = f"{ESY_API_BASE_URL}{ESY_API_CERT_ENDPOINT}"
+        self._update_device_urls()
+        # Credentials are fixed for the lifetime of the instance
+        self._login_body = json.dumps({
+            "password": password,
+            "clientId": "",
+            "requestType": 1,
+            "loginType": "PASSWORD",
+            "userType": 2,
+            "userName": username,
+        }).encode()
+        # Rebuilt only when a new token is stored
+        self._auth_headers: Dict[str, str] = {}
+        # Serialises refresh/login so concurrent callers share one round-trip
+        self._auth_lock = asyncio.Lock()
+
+    def _update_device_urls(self) -> None:
+        """Rebuild the URLs that embed the device ID."""
+        self._obtain_url = f"{ESY_API_BASE_URL}{ESY_API_OBTAIN_ENDPOINT}{self.device_id}"
+        self._schedule_query_url = (
+            f"{ESY_API_BASE_URL}{ESY_API_SOCSCHEDULES_QUERY_ENDPOINT}{self.device_id}"
+        )
+        self._device_info_url = f"{ESY_API_BASE_URL}{ESY_API_DEVICE_INFO}?id={self.device_id}"
+
+    def _store_tokens(self, token_data: Dict[str, Any]) -> int:
+        """Store tokens from a login/refresh response and return expires_in."""
+        self.access_token = token_data.get("access_token")
+        self.refresh_token = token_data.get("refresh_token")
+        expires_in = token_data.get("expires_in", 0)
+        # Refresh 60 seconds before the actual expiry
+        self._expiry_monotonic = time.monotonic() + max(0, expires_in - 60)
+        self._auth_headers = {"Authorization": f"bearer {self.access_token}"}
+        return expires_in
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
+        """Get the injected session, or create a private one if needed."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                timeout=REQUEST_TIMEOUT,
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=4,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                # Bearer-token API; nothing needs cookies tracked
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+            self._owns_session = True
         return self._session
 
     async def close_session(self):
-        """Close the aiohttp session."""
+        """Close the aiohttp session if this instance created it."""
+        if not self._owns_session:
+            return
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
@@ -134,9 +250,12 @@ class ESYSunhomeAPI:
         """
         # Ensure we have a valid token
         await self.get_bearer_token()
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
         
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"bearer {self.access_token}"
+        extra_headers = kwargs.pop("headers", None)
+        headers = self._auth_headers
+        if extra_headers:
+            headers = {**extra_headers, **headers}
         
         session = await self._get_session()
         
@@ -147,42 +266,53 @@ class ESYSunhomeAPI:
             if status == 401 and retry_auth:
                 _LOGGER.warning("Received 401, attempting to refresh token and retry")
                 
-                # Try to refresh the token
-                self.access_token = None  # Force token refresh
-                await self.get_bearer_token()
+                # The server rejected the token, so log in again directly
+                # rather than going back through the expiry check. Skip the
+                # login if another caller already replaced the token.
+                rejected_token = self.access_token
+                async with self._auth_lock:
+                    if self.access_token == rejected_token:
+                        self.access_token = None
+                        self._expiry_monotonic = 0.0
+                        await self.authenticate()
                 
                 # Retry the request with new token
-                headers["Authorization"] = f"bearer {self.access_token}"
+                headers = self._auth_headers
+                if extra_headers:
+                    headers = {**extra_headers, **headers}
                 async with session.request(method, url, headers=headers, **kwargs) as retry_response:
-                    status = retry_response.status
-                    try:
-                        data = await retry_response.json()
-                    except:
-                        data = await retry_response.text()
-                    return status, data
+                    return retry_response.status, await self._read_response(retry_response)
             
-            # Parse response
+            return status, await self._read_response(response)
+
+    @staticmethod
+    async def _read_response(response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body, falling back to text otherwise."""
+        if response.content_type == "application/json":
             try:
-                data = await response.json()
-            except:
-                data = await response.text()
-            
-            return status, data
+                return await response.json(loads=json_loads)
+            except ValueError:
+                pass
+        return await response.text()
 
     async def get_bearer_token(self):
         """Fetch the bearer token using the provided credentials asynchronously.
         
         This method ONLY handles token management. Device fetching is separate.
         """
-        # Check if the token has expired
-        if self.is_token_expired():
-            _LOGGER.info("Access token expired, refreshing token")
-            if not await self.refresh_access_token():
-                _LOGGER.warning("Failed to refresh access token. Re-authenticating")
+        if self.access_token and not self.is_token_expired():
+            return
+
+        async with self._auth_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self.access_token:
+                # If no token is available, authenticate
                 await self.authenticate()
-        elif not self.access_token:
-            # If no token is available, authenticate
-            await self.authenticate()
+            elif self.is_token_expired():
+                _LOGGER.info("Access token expired, refreshing token")
+                if not await self.refresh_access_token():
+                    _LOGGER.warning("Failed to refresh access token. Re-authenticating")
+                    await self.authenticate()
 
     async def ensure_device_id(self):
         """Ensure we have a device ID, fetching if necessary.
@@ -195,32 +325,21 @@ class ESYSunhomeAPI:
     @retry_with_backoff(max_retries=2, initial_delay=1.0)
     async def authenticate(self):
         """Authenticate and retrieve the initial bearer token."""
-        url = f"{ESY_API_BASE_URL}{ESY_API_LOGIN_ENDPOINT}"
-        headers = {"Content-Type": "application/json"}
-        login_data = {
-            "password": self.password,
-            "clientId": "",
-            "requestType": 1,
-            "loginType": "PASSWORD",
-            "userType": 2,
-            "userName": self.username,
-        }
-
         session = await self._get_session()
-        async with session.post(url, json=login_data, headers=headers) as response:
+        async with session.post(
+            self._login_url,
+            data=self._login_body,
+            headers=JSON_HEADERS,
+            timeout=REQUEST_TIMEOUT,
+        ) as response:
             if response.status == 200:
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
                 # Extract tokens and expiration time
-                self.access_token = data["data"].get("access_token")
-                self.refresh_token = data["data"].get("refresh_token")
-                expires_in = data["data"].get("expires_in", 0)
-                self.token_expiry = datetime.utcnow() + timedelta(
-                    seconds=expires_in
-                )
+                expires_in = self._store_tokens(data["data"])
 
                 _LOGGER.info("Successfully authenticated and retrieved access token")
-                _LOGGER.debug(f"Token expires in {expires_in} seconds")
+                _LOGGER.debug("Token expires in %s seconds", expires_in)
             else:
                 error_text = await response.text()
                 _LOGGER.error(f"Authentication failed: {response.status} - {error_text}")
@@ -234,8 +353,8 @@ class ESYSunhomeAPI:
             _LOGGER.warning("No refresh token available, will re-authenticate")
             return False
 
-        url = f"{ESY_API_BASE_URL}/token"  # Adjust URL if needed for the refresh endpoint
-        headers = {"Content-Type": "application/json"}
+        url = self._refresh_url  # Adjust URL if needed for the refresh endpoint
+        headers = JSON_HEADERS
         refresh_data = {
             "grant_type": "refresh_token",
             "refresh_token": self.refresh_token,
@@ -243,16 +362,13 @@ class ESYSunhomeAPI:
 
         try:
             session = await self._get_session()
-            async with session.post(url, json=refresh_data, headers=headers) as response:
+            async with session.post(
+                url, json=refresh_data, headers=headers, timeout=REQUEST_TIMEOUT
+            ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     # Extract new tokens and expiration time
-                    self.access_token = data["data"].get("access_token")
-                    self.refresh_token = data["data"].get("refresh_token")
-                    expires_in = data["data"].get("expires_in", 0)
-                    self.token_expiry = datetime.utcnow() + timedelta(
-                        seconds=expires_in
-                    )
+                    self._store_tokens(data["data"])
 
                     _LOGGER.info("Access token successfully refreshed")
                     return True
@@ -266,35 +382,57 @@ class ESYSunhomeAPI:
 
     def is_token_expired(self) -> bool:
         """Check if the access token has expired."""
-        if not self.token_expiry:
-            return True
-        # Add a 60 second buffer before actual expiry
-        return datetime.utcnow() >= (self.token_expiry - timedelta(seconds=60))
+        return time.monotonic() >= self._expiry_monotonic
 
     @retry_with_backoff(max_retries=2, initial_delay=1.0)
     async def fetch_device(self):
         """Fetch the device (inverter) ID associated with the user."""
-        url = f"{ESY_API_BASE_URL}{ESY_API_DEVICE_ENDPOINT}"
+        url = self._device_url
         
         status, data = await self._make_request_with_auth("GET", url)
         
         if status == 200:
             if isinstance(data, dict) and "data" in data:
                 self.device_id = data["data"]["records"][0]["id"]
+                self._update_device_urls()
                 _LOGGER.info(f"Device ID retrieved: {self.device_id}")
+                if self._on_device_id_resolved is not None:
+                    self._on_device_id_resolved(self.device_id)
             else:
-                raise Exception(f"Unexpected response format: {data}")
+                raise ESYApiError(f"Unexpected response format: {data}")
         else:
-            raise Exception(
-                f"Failed to fetch device ID. Status code: {status}, Response: {data}"
+            raise ESYApiError(
+                f"Failed to fetch device ID. Status code: {status}, Response: {data}",
+                status=status,
             )
 
+    async def get_devices(self) -> list:
+        """Fetch all device records registered to the account."""
+        status, data = await self._make_request_with_auth("GET", self._device_url)
+
+        if status == 200 and isinstance(data, dict):
+            devices = (data.get("data") or {}).get("records", [])
+            _LOGGER.debug("Found %d devices", len(devices))
+            return devices
+        raise ESYApiError(f"Failed to fetch devices: HTTP {status}", status=status)
+
+    async def get_device_detail(self, device_id: str) -> Dict[str, Any]:
+        """Fetch the detail record (protocol parameters) for a device."""
+        url = f"{ESY_API_BASE_URL}/api/lsydevice/detail?deviceId={device_id}"
+        status, data = await self._make_request_with_auth("GET", url)
+
+        if status == 200 and isinstance(data, dict):
+            return data.get("data") or {}
+        raise ESYApiError(
+            f"Failed to fetch device details: HTTP {status}", status=status
+        )
+
     @retry_with_backoff(max_retries=2, initial_delay=2.0)
     async def request_update(self):
         """Call the /api/param/set/obtain endpoint and publish data to MQTT."""
         await self.ensure_device_id()
         
-        url = f"{ESY_API_BASE_URL}{ESY_API_OBTAIN_ENDPOINT}{self.device_id}"
+        url = self._obtain_url
         
         status, data = await self._make_request_with_auth("GET", url)
         
@@ -302,8 +440,9 @@ class ESYSunhomeAPI:
             _LOGGER.debug("Data update requested successfully")
         else:
             _LOGGER.warning(f"Data update request returned status {status}: {data}")
-            raise Exception(
-                f"Failed to request data update. Status code: {status}"
+            raise ESYApiError(
+                f"Failed to request data update. Status code: {status}",
+                status=status,
             )
 
     @retry_with_backoff(max_retries=3, initial_delay=2.0, backoff_factor=1.5)
@@ -318,7 +457,7 @@ class ESYSunhomeAPI:
         """
         await self.ensure_device_id()
 
-        url = f"{ESY_API_BASE_URL}{ESY_API_MODE_ENDPOINT}"
+        url = self._mode_url
 
         # iOS app sends JSON body with integer code
         json_data = {
@@ -343,13 +482,13 @@ class ESYSunhomeAPI:
                     _LOGGER.error(
                         "API SET_MODE failed: code=%s, msg='%s'", code, message
                     )
-                    raise Exception(f"Mode change failed (code={code}): {message}")
+                    raise ESYApiError(f"Mode change failed (code={code}): {message}")
 
             _LOGGER.info(f"Mode successfully updated to {mode}")
         else:
             _LOGGER.error(f"Failed to set mode. Status: {status}, Response: {data}")
-            raise Exception(
-                f"Failed to set mode. Status code: {status}"
+            raise ESYApiError(
+                f"Failed to set mode. Status code: {status}", status=status
             )
 
     @retry_with_backoff(max_retries=2, initial_delay=1.0)
@@ -362,7 +501,7 @@ class ESYSunhomeAPI:
         """
         await self.ensure_device_id()
 
-        url = f"{ESY_API_BASE_URL}{ESY_API_SOCSCHEDULES_QUERY_ENDPOINT}{self.device_id}"
+        url = self._schedule_query_url
 
         status, data = await self._make_request_with_auth("GET", url)
 
@@ -371,7 +510,10 @@ class ESYSunhomeAPI:
             _LOGGER.debug("Retrieved schedule: %s", schedule)
             return schedule
         else:
-            raise Exception(f"Failed to fetch schedule. Status: {status}, Response: {data}")
+            raise ESYApiError(
+                f"Failed to fetch schedule. Status: {status}, Response: {data}",
+                status=status if status != 200 else None,
+            )
 
     @retry_with_backoff(max_retries=2, initial_delay=1.0)
     async def save_schedule(self, schedule: Dict[str, Any]) -> None:
@@ -386,7 +528,7 @@ class ESYSunhomeAPI:
         """
         await self.ensure_device_id()
 
-        url = f"{ESY_API_BASE_URL}{ESY_API_SOCSCHEDULES_SAVE_ENDPOINT}"
+        url = self._schedule_save_url
 
         # Ensure deviceId is set
         payload = dict(schedule)
@@ -406,10 +548,13 @@ class ESYSunhomeAPI:
             code = data.get("code", 0)
             if code != 0:
                 msg = data.get("msg", "") or data.get("message", "")
-                raise Exception(f"Schedule save failed (code={code}): {msg}")
+                raise ESYApiError(f"Schedule save failed (code={code}): {msg}")
             _LOGGER.info("Schedule saved successfully")
         else:
-            raise Exception(f"Failed to save schedule. Status: {status}, Response: {data}")
+            raise ESYApiError(
+                f"Failed to save schedule. Status: {status}, Response: {data}",
+                status=status if status != 200 else None,
+            )
 
     @retry_with_backoff(max_retries=2, initial_delay=1.0)
     async def get_device_info(self) -> Dict[str, Any]:
@@ -420,7 +565,7 @@ class ESYSunhomeAPI:
         """
         await self.ensure_device_id()
         
-        url = f"{ESY_API_BASE_URL}{ESY_API_DEVICE_INFO}?id={self.device_id}"
+        url = self._device_info_url
         
         status, data = await self._make_request_with_auth("GET", url)
         
@@ -430,10 +575,14 @@ class ESYSunhomeAPI:
             # Log the configured mode if present
             if "code" in device_info:
                 _LOGGER.info(f"Device configured mode code: {device_info.get('code')}")
-            _LOGGER.debug(f"Full device info keys: {list(device_info.keys())}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Full device info keys: %s", list(device_info))
             return device_info
         else:
-            raise Exception(f"Failed to fetch device info. Status: {status}, Response: {data}")
+            raise ESYApiError(
+                f"Failed to fetch device info. Status: {status}, Response: {data}",
+                status=status if status != 200 else None,
+            )
 
     @retry_with_backoff(max_retries=2, initial_delay=1.0)
     async def get_mqtt_certs(self) -> Dict[str, Any]:
@@ -442,7 +591,7 @@ class ESYSunhomeAPI:
         Returns:
             Dict with mqttDomain, port, ca, clientCrt, clientKey URLs
         """
-        url = f"{ESY_API_BASE_URL}{ESY_API_CERT_ENDPOINT}"
+        url = self._cert_url
         
         status, data = await self._make_request_with_auth("GET", url)
         
@@ -451,7 +600,10 @@ class ESYSunhomeAPI:
             _LOGGER.info(f"Retrieved MQTT cert info: domain={cert_info.get('mqttDomain')}, port={cert_info.get('port')}")
             return cert_info
         else:
-            raise Exception(f"Failed to fetch MQTT certs. Status: {status}, Response: {data}")
+            raise ESYApiError(
+                f"Failed to fetch MQTT certs. Status: {status}, Response: {data}",
+                status=status if status != 200 else None,
+            )
 
     async def download_file(self, url: str, dest_path: str) -> bool:
         """Download a file from URL to local path.
@@ -467,7 +619,7 @@ class ESYSunhomeAPI:
         
         try:
             session = await self._get_session()
-            async with session.get(url) as response:
+            async with session.get(url, timeout=DOWNLOAD_TIMEOUT) as response:
                 if response.status == 200:
                     content = await response.read()
                     
@@ -477,7 +629,7 @@ class ESYSunhomeAPI:
                             f.write(content)
                     
                     await asyncio.get_event_loop().run_in_executor(None, write_file)
-                    _LOGGER.debug(f"Downloaded {len(content)} bytes to {dest_path}")
+                    _LOGGER.debug("Downloaded %d bytes to %s", len(content), dest_path)
                     return True
                 else:
                     _LOGGER.error(f"Failed to download {url}: {response.status}")
@@ -7,8 +7,8 @@ from the ESY API, ensuring correct mappings for all device models.
 
 import struct
 import logging
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, NamedTuple, Tuple, Union
 from enum import IntEnum
 
 from .protocol_api import ProtocolDefinition, RegisterDefinition, get_protocol_api
@@ -22,6 +22,125 @@ _LOGGER = logging.getLogger(__name__)
 
 HEADER_SIZE = 24
 
+# configId, msgId, userId, funCode, sourceId, pageIndex, dataLength
+_MSG_HEADER = struct.Struct(">II8sBBHI")
+
+# Precompiled big-endian segment count decoder
+_U16 = struct.Struct(">H")
+
+# Complete single-register write: header, then num_ops, address, count, value
+_WRITE_SINGLE_CMD = struct.Struct(_MSG_HEADER.format + "HHHH")
+_WRITE_SINGLE_PAYLOAD_LEN = _WRITE_SINGLE_CMD.size - HEADER_SIZE
+
+# Telemetry segment header: segment id, type (function code), address, count
+_SEG_HEADER = struct.Struct(">HHHH")
+
+# Bulk u16 unpackers for segment values, built once per register count
+_U16_ARRAYS: Dict[int, struct.Struct] = {}
+
+# Decimal coefficients decoded as raw / divisor; for these the true division
+# gives exactly the float round(raw * coefficient, 3) would, without round()
+_COEFF_DIVISORS = {0.1: 10, 0.01: 100, 0.001: 1000}
+
+# Segment type (function code) names for debug logging
+_FC_NAMES = {FC_READ_HOLDING: "Holding", FC_READ_INPUT: "Input"}
+
+
+# Derived keys that take the first non-zero source register, else 0.
+# Each entry is (result key, source keys in priority order).
+_STATUS_FIELDS = (
+    ("batterySoh", ("batterySoh",)),
+    ("inverterTemp", ("invTemperature", "inverterTemp")),
+    ("dcdcTemperature", ("dcdcTemperature",)),
+    ("dailyPowerGeneration", ("dailyEnergyGeneration", "dailyPowerGeneration")),
+    ("totalPowerGeneration", ("totalEnergyGeneration", "totalPowerGeneration")),
+    ("dailyConsumption", ("dailyPowerConsumption", "dailyConsumption")),
+    ("dailyGridExport", ("dailyGridConnectionPower", "dailyGridExport")),
+    ("dailyBattCharge", ("dailyBattChargeEnergy", "dailyBattCharge")),
+    ("dailyBattDischarge", ("dailyBattDischargeEnergy", "dailyBattDischarge")),
+    # Single-phase models expose gridVolt/gridFreq; three-phase models expose
+    # per-phase values instead, so fall back to phase A.
+    ("gridVoltage", ("gridVolt", "gridVoltage", "phaseAgridVoltage")),
+    ("gridFrequency", ("gridFreq", "gridFrequency", "phaseAgridFrequency")),
+    ("batteryVoltage", ("batteryVoltage",)),
+    ("batteryCurrent", ("batteryCurrent",)),
+)
+
+_METER_FLOW_FIELDS = (
+    ("ct1Power", ("ct1Power",)),
+    ("ct2Power", ("ct2Power",)),
+    ("meterPower", ("meterPower",)),
+    ("energyFlowPv", ("energyFlowPvTotalPower", "energyFlowPv")),
+    ("energyFlowBatt", ("energyFlowBattPower", "energyFlowBatt")),
+    ("energyFlowGrid", ("energyFlowGridPower", "energyFlowGrid")),
+    ("energyFlowLoad", ("energyFlowLoadTotalPower", "energyFlowLoad")),
+)
+
+# Source keys in priority order for the derived power / SOC figures
+_GRID_FLOW_SOURCES = ("energyFlowGridPower", "energyFlowGrid")
+_BATT_POWER_SOURCES = ("energyFlowBattPower", "energyFlowBatt", "batteryPower")
+_LOAD_POWER_SOURCES = (
+    "energyFlowLoadTotalPower",
+    "energyFlowLoad",
+    "loadRealTimePower",
+    "loadActivePower",
+    "loadPower",
+)
+_SOC_SOURCES = ("battTotalSoc", "batterySoc")
+
+# batteryStatus code -> (batteryLine, status text). batteryLine is
+# 1 = discharging, 2 = charging, 0 = idle; unknown codes are standby.
+_BATTERY_STATES = {
+    1: (2, "Charging"),
+    2: (2, "Charge Topping"),
+    3: (2, "Float Charge"),
+    4: (0, "Full"),
+    5: (1, "Discharging"),
+    6: (2, "Charging"),
+}
+_BATTERY_IDLE = (0, "Standby")
+
+# MQTT systemRunMode value -> display name (see _compute_derived_values)
+_MODE_NAMES = {
+    1: "Regular Mode",
+    4: "Emergency Mode",
+    3: "Electricity Sell Mode",
+    5: "AC Charging Off Emergency Mode",  # MQTT register 5 value 5 is NOT BEM
+    0: "Battery Priority Mode",
+    2: "Grid Priority Mode",
+    6: "PV Mode",
+    7: "Forced Off Grid Mode",
+}
+
+
+def _first_set(values: Dict[str, Any], sources: tuple) -> Any:
+    """Return the first non-zero source value, equivalent to `a or b or ... or 0`."""
+    get = values.get
+    for source in sources:
+        value = get(source)
+        if value:
+            return value
+    return 0
+
+
+def _set_grid_flow(result: Dict[str, Any], grid_power: Any) -> None:
+    """Store grid power (+import/-export) with its import/export split and line flag."""
+    result["gridPower"] = grid_power
+    result["gridImport"] = grid_power if grid_power > 0 else 0
+    result["gridExport"] = -grid_power if grid_power < 0 else 0
+    result["gridLine"] = 1 if grid_power else 0
+
+
+def _copy_first_set(values: Dict[str, Any], result: Dict[str, Any], fields: tuple) -> None:
+    """Fill result from a field table, equivalent to `a or b or ... or 0`."""
+    get = values.get
+    for key, sources in fields:
+        for source in sources:
+            value = get(source)
+            if value:
+                break
+        result[key] = value or 0
+
 
 class FunctionCode(IntEnum):
     """MQTT message function codes."""
@@ -32,7 +151,7 @@ class FunctionCode(IntEnum):
     ALARM = 0x83
 
 
-@dataclass
+@dataclass(slots=True)
 class MsgHeader:
     """MQTT message header structure."""
     config_id: int
@@ -49,90 +168,78 @@ class MsgHeader:
         if len(data) < HEADER_SIZE:
             return None
         try:
-            config_id = struct.unpack(">I", data[0:4])[0]
-            msg_id = struct.unpack(">I", data[4:8])[0]
-            user_id = data[8:16]
-            fun_code = data[16]
-            source_id = data[17]
-            page_index = struct.unpack(">H", data[18:20])[0]
-            data_length = struct.unpack(">I", data[20:24])[0]
-            return cls(config_id, msg_id, user_id, fun_code, source_id, page_index, data_length)
+            return cls(*_MSG_HEADER.unpack_from(data))
         except Exception as e:
             _LOGGER.error("Failed to parse header: %s", e)
             return None
 
     def to_bytes(self) -> bytes:
         """Serialize header to bytes."""
-        return (
-            struct.pack(">I", self.config_id)
-            + struct.pack(">I", self.msg_id)
-            + self.user_id
-            + bytes([self.fun_code, self.source_id])
-            + struct.pack(">H", self.page_index)
-            + struct.pack(">I", self.data_length)
+        return _MSG_HEADER.pack(
+            self.config_id,
+            self.msg_id,
+            self.user_id,
+            self.fun_code,
+            self.source_id,
+            self.page_index,
+            self.data_length,
         )
 
 
-@dataclass
-class ParamSegment:
+class ParamSegment(NamedTuple):
     """Represents a segment of parameters in the payload."""
     segment_id: int
     segment_type: int
     segment_address: int
     params_num: int
-    values: bytes = field(default_factory=bytes)
+    values: Union[bytes, memoryview] = b""
 
 
 class PayloadParser:
     """Parser for MQTT payload segments."""
 
-    def parse(self, payload: bytes) -> List[ParamSegment]:
+    def parse(self, payload: Union[bytes, memoryview]) -> List[ParamSegment]:
         """Parse payload into segments."""
-        if len(payload) < 2:
+        size = len(payload)
+        if size < 2:
             return []
 
         # First 2 bytes are segment count
-        segment_count = (payload[0] << 8) | payload[1]
-        _LOGGER.debug("PayloadParser: segment_count = %d, total data = %d bytes", 
-                     segment_count, len(payload))
+        segment_count = _U16.unpack_from(payload)[0]
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("PayloadParser: segment_count = %d, total data = %d bytes",
+                          segment_count, size)
 
         segments = []
         pos = 2
 
         for i in range(segment_count):
-            if pos + 8 > len(payload):
+            if pos + 8 > size:
                 _LOGGER.warning("Not enough data for segment %d header", i)
                 break
 
-            # Each segment header is 8 bytes (4 x 16-bit values)
-            seg_id = (payload[pos] << 8) | payload[pos + 1]
-            seg_type = (payload[pos + 2] << 8) | payload[pos + 3]  # Function code: 3=Holding, 4=Input
-            seg_addr = (payload[pos + 4] << 8) | payload[pos + 5]
-            params_num = (payload[pos + 6] << 8) | payload[pos + 7]
+            # Each segment header is 8 bytes (4 x 16-bit values); the type
+            # is the function code: 3=Holding, 4=Input
+            seg_id, seg_type, seg_addr, params_num = _SEG_HEADER.unpack_from(payload, pos)
             pos += 8
 
             # Values length is params_num * 2 (each param is 16 bits)
             values_len = params_num * 2
-            if pos + values_len > len(payload):
+            if pos + values_len > size:
                 _LOGGER.warning("Segment %d: not enough data (need %d, have %d)",
-                               i, values_len, len(payload) - pos)
+                               i, values_len, size - pos)
                 break
 
             seg_values = payload[pos:pos + values_len]
             pos += values_len
 
-            segment = ParamSegment(
-                segment_id=seg_id,
-                segment_type=seg_type,
-                segment_address=seg_addr,
-                params_num=params_num,
-                values=seg_values
-            )
-            segments.append(segment)
+            segments.append(ParamSegment(seg_id, seg_type, seg_addr, params_num, seg_values))
 
-            fc_name = "Holding" if seg_type == 3 else "Input" if seg_type == 4 else f"FC{seg_type}"
-            _LOGGER.debug("Segment[%d]: id=%d, type=%d (%s), addr=%d (0x%04X), params=%d",
-                         i, seg_id, seg_type, fc_name, seg_addr, seg_addr, params_num)
+            if debug:
+                _LOGGER.debug("Segment[%d]: id=%d, type=%d (%s), addr=%d (0x%04X), params=%d",
+                              i, seg_id, seg_type, _FC_NAMES.get(seg_type, f"FC{seg_type}"),
+                              seg_addr, seg_addr, params_num)
 
         return segments
 
@@ -184,6 +291,11 @@ class DynamicTelemetryParser:
             "totalHouseholdLoadPower": "loadActivePower",
         }
 
+        # Per-segment decode plans, keyed by (function code, start address,
+        # register count). Segment layouts are fixed per model, so register
+        # lookups and key/coefficient resolution are done once per layout.
+        self._decode_plans: Dict[Tuple[int, int, int], Tuple[tuple, tuple, tuple]] = {}
+
     def set_tp_type(self, tp_type: int) -> None:
         """Set the site phase type (1 = single-phase, 3 = three-phase)."""
         try:
@@ -195,6 +307,7 @@ class DynamicTelemetryParser:
     def set_protocol(self, protocol: ProtocolDefinition):
         """Set the protocol definition to use."""
         self.protocol = protocol
+        self._decode_plans.clear()
         _LOGGER.info("Protocol definition updated: %d input regs, %d holding regs",
                      len(protocol.input_registers), len(protocol.holding_registers))
 
@@ -213,8 +326,9 @@ class DynamicTelemetryParser:
         _LOGGER.debug("Header: configId=%d, funCode=%d, pageIndex=%d, dataLen=%d",
                      header.config_id, header.fun_code, header.page_index, header.data_length)
 
-        # Extract and parse payload
-        payload = data[HEADER_SIZE:HEADER_SIZE + header.data_length]
+        # Extract and parse payload; segment values become views into the
+        # message rather than copies
+        payload = memoryview(data)[HEADER_SIZE:HEADER_SIZE + header.data_length]
         segments = self.payload_parser.parse(payload)
         
         _LOGGER.debug("Parsed %d segments", len(segments))
@@ -235,77 +349,148 @@ class DynamicTelemetryParser:
         all_values["_pageIndex"] = header.page_index
         all_values["_funCode"] = header.fun_code
         all_values["_segmentCount"] = len(segments)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
         for segment in segments:
-            base_addr = segment.segment_address
             values_bytes = segment.values
+            count = min(segment.params_num, len(values_bytes) // 2)
+            if count <= 0:
+                continue
+
+            unpacker = _U16_ARRAYS.get(count)
+            if unpacker is None:
+                unpacker = _U16_ARRAYS[count] = struct.Struct(f">{count}H")
+            raw_values = unpacker.unpack_from(values_bytes)
 
             # Use segment_type as the function code (3=Holding, 4=Input)
-            fc = segment.segment_type
-
-            for i in range(segment.params_num):
-                abs_addr = base_addr + i
-                offset = i * 2
-
-                if offset + 2 > len(values_bytes):
-                    break
-
-                raw_unsigned = (values_bytes[offset] << 8) | values_bytes[offset + 1]
-                
-                # Try to find register in protocol
-                reg = None
-                if self.protocol:
-                    reg = self.protocol.get_register(abs_addr, fc)
-                
-                if reg:
-                    # Apply data type
-                    if reg.data_type == DATA_TYPE_SIGNED and raw_unsigned > 32767:
-                        raw_value = raw_unsigned - 65536
-                    else:
-                        raw_value = raw_unsigned
-                    
-                    # Apply coefficient
-                    if reg.coefficient != 1:
-                        value = round(raw_value * reg.coefficient, 3)
-                    else:
-                        value = raw_value
-                    
-                    # Store with original key
-                    all_values[reg.data_key] = value
-                    
-                    # Also store with legacy key if applicable
-                    if reg.data_key in self._legacy_key_map:
-                        all_values[self._legacy_key_map[reg.data_key]] = value
-                    
+            known, wide, unknown = self._get_decode_plan(
+                segment.segment_type, segment.segment_address, count
+            )
+
+            for i, key, legacy_key, signed, coeff, divisor in known:
+                raw_unsigned = raw_values[i]
+
+                # Apply data type
+                if signed and raw_unsigned > 32767:
+                    raw_value = raw_unsigned - 65536
+                else:
+                    raw_value = raw_unsigned
+
+                # Apply coefficient
+                if divisor:
+                    value = raw_value / divisor
+                elif coeff != 1:
+                    value = round(raw_value * coeff, 3)
+                else:
+                    value = raw_value
+
+                # Store with original key, and legacy key if applicable
+                all_values[key] = value
+                if legacy_key:
+                    all_values[legacy_key] = value
+
+                if debug:
                     _LOGGER.debug("%s = %s (raw=%d, coeff=%s, addr=%d)",
-                                 reg.data_key, value, raw_value, reg.coefficient, abs_addr)
+                                  key, value, raw_value, coeff, segment.segment_address + i)
+
+            # 32-bit registers: high word first, combined in one step
+            for i, key, legacy_key, signed, coeff, divisor in wide:
+                raw_value = (raw_values[i] << 16) | raw_values[i + 1]
+                if signed and raw_value > 0x7FFFFFFF:
+                    raw_value -= 0x100000000
+                if divisor:
+                    value = raw_value / divisor
                 else:
-                    # Store unknown registers for debugging
-                    if raw_unsigned != 0:
-                        all_values[f"_unknown_fc{fc}_addr{abs_addr}"] = raw_unsigned
+                    value = round(raw_value * coeff, 3) if coeff != 1 else raw_value
+
+                all_values[key] = value
+                if legacy_key:
+                    all_values[legacy_key] = value
+
+                if debug:
+                    _LOGGER.debug("%s = %s (raw32=%d, coeff=%s, addr=%d)",
+                                  key, value, raw_value, coeff, segment.segment_address + i)
+
+            # Store unknown registers for debugging
+            for i, key in unknown:
+                raw_unsigned = raw_values[i]
+                if raw_unsigned != 0:
+                    all_values[key] = raw_unsigned
 
         return all_values
 
+    def _get_decode_plan(
+        self, fc: int, base_addr: int, count: int
+    ) -> Tuple[tuple, tuple, tuple]:
+        """Return the cached decode plan for a segment layout.
+
+        The plan is three tuples: 16-bit registers and 32-bit registers as
+        (index, key, legacy_key, signed, coefficient, divisor), and registers
+        missing from the protocol map as (index, ``_unknown_*`` key). Splitting
+        them keeps the per-register loops free of lookups and type checks.
+        ``divisor`` is non-zero for 0.1/0.01/0.001 coefficients.
+        """
+        plan_key = (fc, base_addr, count)
+        plan = self._decode_plans.get(plan_key)
+        if plan is not None:
+            return plan
+
+        known = []
+        wide = []
+        unknown = []
+        low_words = set()
+        for i in range(count):
+            abs_addr = base_addr + i
+            reg = self.protocol.get_register(abs_addr, fc) if self.protocol else None
+            if reg:
+                entry = (
+                    i,
+                    reg.data_key,
+                    self._legacy_key_map.get(reg.data_key),
+                    reg.data_type == DATA_TYPE_SIGNED,
+                    reg.coefficient,
+                    _COEFF_DIVISORS.get(reg.coefficient, 0),
+                )
+                # A 32-bit register needs its low word in the same segment;
+                # otherwise only the high word can be decoded
+                if reg.is_32bit and i + 1 < count:
+                    wide.append(entry)
+                    low_words.add(i + 1)
+                else:
+                    known.append(entry)
+            elif i not in low_words:
+                unknown.append((i, f"_unknown_fc{fc}_addr{abs_addr}"))
+
+        plan = self._decode_plans[plan_key] = (tuple(known), tuple(wide), tuple(unknown))
+        return plan
+
     def _compute_derived_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
-        """Compute derived values for compatibility."""
-        result = dict(values)
+        """Compute derived values for compatibility.
+
+        Derived keys are written into ``values`` in place and the same dict is
+        returned; parse_message hands over a dict nothing else holds. Each
+        source key is read before its derived key is written.
+        """
+        result = values
+        get = values.get
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         
         # === PV POWER ===
         # DC PV: pv1Power + pv2Power (panels connected to inverter DC inputs)
         # AC PV: ct2Power when positive (AC-coupled solar, measured by CT2)
         # Total PV = DC PV + AC PV
         
-        pv1 = values.get("pv1Power", 0) or 0
-        pv2 = values.get("pv2Power", 0) or 0
+        pv1 = get("pv1Power", 0) or 0
+        pv2 = get("pv2Power", 0) or 0
         dc_pv_power = pv1 + pv2
         
         # ct2Power measures AC-coupled solar when positive
         # (when negative, it's consumption, not generation)
-        ct2_power = values.get("ct2Power", 0) or 0
+        ct2_power = get("ct2Power", 0) or 0
         ac_pv_power = max(0, ct2_power)  # Only count positive values as AC PV
         
         # energyFlowPvTotalPower is the app's display value - may include both
-        energy_flow_pv = values.get("energyFlowPvTotalPower", 0) or 0
+        energy_flow_pv = int(get("energyFlowPvTotalPower", 0) or 0)
         
         # Calculate total PV power
         # If we have DC PV, add AC PV to get total
@@ -313,7 +498,7 @@ class DynamicTelemetryParser:
         if dc_pv_power > 0 or ac_pv_power > 0:
             total_pv_power = dc_pv_power + ac_pv_power
         else:
-            total_pv_power = int(energy_flow_pv)
+            total_pv_power = energy_flow_pv
         
         result["pvPower"] = total_pv_power
         result["dcPvPower"] = dc_pv_power  # ESY PV (DC-coupled)
@@ -322,8 +507,9 @@ class DynamicTelemetryParser:
         result["pv2Power"] = pv2
         result["pvLine"] = 1 if total_pv_power > 10 else 0
         
-        _LOGGER.debug("PV: pv1=%d, pv2=%d (DC=%d), ct2=%d (AC=%d), energyFlow=%d -> total=%d",
-                     pv1, pv2, dc_pv_power, ct2_power, ac_pv_power, int(energy_flow_pv), total_pv_power)
+        if debug:
+            _LOGGER.debug("PV: pv1=%d, pv2=%d (DC=%d), ct2=%d (AC=%d), energyFlow=%d -> total=%d",
+                         pv1, pv2, dc_pv_power, ct2_power, ac_pv_power, energy_flow_pv, total_pv_power)
         
         # === GRID POWER ===
         # Different inverter setups use different sensors for grid power:
@@ -333,20 +519,20 @@ class DynamicTelemetryParser:
         # - energyFlowGridPower matches the app display
         # Negative values = importing FROM grid
         
-        ct1_power = values.get("ct1Power") or 0
-        ct2_power = values.get("ct2Power") or 0
-        grid_active_power = values.get("gridActivePower") or 0
-        energy_flow_grid = values.get("energyFlowGridPower", 0) or values.get("energyFlowGrid", 0) or 0
+        ct1_power = get("ct1Power") or 0
+        ct2_power = get("ct2Power") or 0
+        grid_active_power = get("gridActivePower") or 0
+        energy_flow_grid = _first_set(values, _GRID_FLOW_SOURCES)
 
         # Three-phase models don't expose ct1Power/gridActivePower; their grid
         # power comes from totalgridActivePower, or the sum of the per-phase
         # active powers. Same ESY sign convention (negative = importing).
-        total_grid_active = values.get("totalgridActivePower") or 0
+        total_grid_active = get("totalgridActivePower") or 0
         if not total_grid_active:
             per_phase = (
-                (values.get("phaseAgridActivePower") or 0)
-                + (values.get("phaseBgridActivePower") or 0)
-                + (values.get("phaseCgridActivePower") or 0)
+                (get("phaseAgridActivePower") or 0)
+                + (get("phaseBgridActivePower") or 0)
+                + (get("phaseCgridActivePower") or 0)
             )
             total_grid_active = per_phase
 
@@ -359,7 +545,7 @@ class DynamicTelemetryParser:
             # unit it under-reports whole-site grid, so exclude it. Prefer the
             # inverter in-flow figure the ESY app shows (already +import), then
             # the whole-site active total, then the ESY energy-flow grid figure.
-            flow_inflow = values.get("totalPowerOfGridInFlow")
+            flow_inflow = get("totalPowerOfGridInFlow")
             if flow_inflow is not None and abs(flow_inflow) > 10:
                 grid_power = round(flow_inflow)          # already +import
                 grid_source = "flow3p"
@@ -398,23 +584,12 @@ class DynamicTelemetryParser:
             grid_power = -esy_raw  # Flip ESY convention -> HA (+import)
 
         # HA convention: gridPower positive = import, negative = export.
-        result["gridPower"] = grid_power
-        if grid_power > 0:
-            result["gridImport"] = grid_power
-            result["gridExport"] = 0
-            result["gridLine"] = 1
-        elif grid_power < 0:
-            result["gridImport"] = 0
-            result["gridExport"] = -grid_power
-            result["gridLine"] = 1
-        else:
-            result["gridImport"] = 0
-            result["gridExport"] = 0
-            result["gridLine"] = 0
+        _set_grid_flow(result, grid_power)
 
-        _LOGGER.debug("Grid: ct1=%d, ct2=%d, active=%d, total3p=%d, flow=%d -> power=%d [%s] (import=%d, export=%d)",
-                     ct1_power, ct2_power, grid_active_power, total_grid_active, int(energy_flow_grid),
-                     grid_power, grid_source, result["gridImport"], result["gridExport"])
+        if debug:
+            _LOGGER.debug("Grid: ct1=%d, ct2=%d, active=%d, total3p=%d, flow=%d -> power=%d [%s] (import=%d, export=%d)",
+                         ct1_power, ct2_power, grid_active_power, total_grid_active, int(energy_flow_grid),
+                         grid_power, grid_source, result["gridImport"], result["gridExport"])
         
         # === BATTERY POWER ===
         # Standard convention: Positive = Charging, Negative = Discharging
@@ -424,11 +599,7 @@ class DynamicTelemetryParser:
         # totalPowerOfBatteryInFlow). The raw batteryPower register is DC-side
         # and reads higher by the conversion loss (e.g. 2.6kW DC vs 2.2kW AC).
         # Fall back to batteryPower when the flow figure is absent/zero.
-        raw_batt_power = (
-            values.get("energyFlowBattPower") or
-            values.get("energyFlowBatt") or
-            values.get("batteryPower") or 0
-        )
+        raw_batt_power = _first_set(values, _BATT_POWER_SOURCES)
 
         # Battery power from inverter is absolute - use batteryStatus to determine direction
         # batteryStatus codes from APK/Modbus register 28:
@@ -439,72 +610,34 @@ class DynamicTelemetryParser:
         # 4: Full
         # 5: Discharging
         # 6+: Charging
-        battery_status = values.get("batteryStatus", 0) or 0
-        
-        # Status text mapping
-        BATTERY_STATUS_TEXT = {
-            0: "Standby",
-            1: "Charging",
-            2: "Charge Topping",
-            3: "Float Charge",
-            4: "Full",
-            5: "Discharging",
-        }
+        battery_status = get("batteryStatus", 0) or 0
         
-        # Determine charge/discharge based on status code
-        if battery_status == 5:
-            # Discharging
-            is_charging = False
-            is_discharging = True
-            status_text = "Discharging"
-        elif battery_status in (1, 2, 3, 6):
-            # Charging (various charging states)
-            is_charging = True
-            is_discharging = False
-            status_text = BATTERY_STATUS_TEXT.get(battery_status, "Charging")
-        elif battery_status == 4:
-            # Full - not actively charging/discharging
-            is_charging = False
-            is_discharging = False
-            status_text = "Full"
-        else:
-            # 0 or unknown - standby/idle
-            is_charging = False
-            is_discharging = False
-            status_text = "Standby"
+        # Direction (batteryLine) and status text from the status code
+        battery_line, status_text = _BATTERY_STATES.get(battery_status, _BATTERY_IDLE)
         
         # Make battery power absolute since direction comes from status
         batt_power = abs(raw_batt_power)
         
         # If power is 0 but status says full, keep full status
         # If power is 0 and status is not 4 (full), show as standby
-        if batt_power == 0 and battery_status != 4:
-            is_charging = False
-            is_discharging = False
-            status_text = "Standby"
+        if batt_power == 0:
+            battery_line = 0
+            if battery_status != 4:
+                status_text = "Standby"
         
         result["batteryPower"] = batt_power
         result["batteryStatus"] = battery_status
         
-        # Directional battery power for HA sensors
-        if is_discharging and batt_power > 0:
-            result["batteryImport"] = 0
-            result["batteryExport"] = batt_power  # Discharging = export (from battery)
-            result["batteryStatusText"] = status_text
-            result["batteryLine"] = 1
-        elif is_charging and batt_power > 0:
-            result["batteryImport"] = batt_power  # Charging = import (into battery)
-            result["batteryExport"] = 0
-            result["batteryStatusText"] = status_text
-            result["batteryLine"] = 2
-        else:
-            result["batteryImport"] = 0
-            result["batteryExport"] = 0
-            result["batteryStatusText"] = status_text
-            result["batteryLine"] = 0
+        # Directional battery power for HA sensors:
+        # discharging = export (from battery), charging = import (into battery)
+        result["batteryImport"] = batt_power if battery_line == 2 else 0
+        result["batteryExport"] = batt_power if battery_line == 1 else 0
+        result["batteryStatusText"] = status_text
+        result["batteryLine"] = battery_line
         
-        _LOGGER.debug("Battery: raw=%d, status=%d (%s), power=%d", 
-                     raw_batt_power, battery_status, status_text, batt_power)
+        if debug:
+            _LOGGER.debug("Battery: raw=%d, status=%d (%s), power=%d", 
+                         raw_batt_power, battery_status, status_text, batt_power)
         
         # === LOAD POWER ===
         # Prefer the inverter's energy-flow load figure (what the ESY app shows
@@ -512,13 +645,7 @@ class DynamicTelemetryParser:
         # fall through to the load registers (unchanged behaviour). Three-phase
         # models expose the whole-site total under totalLoadActivePower /
         # totalHouseholdLoadPower (aliased to the load* keys above).
-        load_power = (
-            values.get("energyFlowLoadTotalPower") or
-            values.get("energyFlowLoad") or
-            values.get("loadRealTimePower") or
-            values.get("loadActivePower") or
-            values.get("loadPower") or 0
-        )
+        load_power = _first_set(values, _LOAD_POWER_SOURCES)
         result["loadPower"] = load_power
         result["loadLine"] = 1 if load_power > 10 else 0
 
@@ -531,12 +658,12 @@ class DynamicTelemetryParser:
         # largest flow so pv + grid + battery == load exactly. Signed convention
         # here: pv >= 0; grid +import/-export; batt +discharge/-charge.
         if self.tp_type == 3:
-            pv = float(result.get("pvPower", 0) or 0)
-            grid = float(result.get("gridPower", 0) or 0)
-            batt = float(result.get("batteryExport", 0) or 0) - float(
-                result.get("batteryImport", 0) or 0
-            )
-            load = float(result.get("loadPower", 0) or 0)
+            # All four are always set numerically above; the arithmetic
+            # below promotes to float on its own
+            pv = result["pvPower"]
+            grid = result["gridPower"]
+            batt = result["batteryExport"] - result["batteryImport"]
+            load = result["loadPower"]
             cur = {"pv": pv, "grid": grid, "batt": batt}
             active = [k for k, v in cur.items() if abs(v) >= 1]
             residual = pv + grid + batt - load
@@ -556,62 +683,26 @@ class DynamicTelemetryParser:
 
                 result["pvPower"] = max(0, round(cur["pv"]))
 
-                g = round(cur["grid"])
-                result["gridPower"] = g
-                if g > 0:
-                    result["gridImport"], result["gridExport"], result["gridLine"] = g, 0, 1
-                elif g < 0:
-                    result["gridImport"], result["gridExport"], result["gridLine"] = 0, -g, 1
-                else:
-                    result["gridImport"], result["gridExport"], result["gridLine"] = 0, 0, 0
+                _set_grid_flow(result, round(cur["grid"]))
 
                 b = round(cur["batt"])  # +discharge / -charge
-                result["batteryPower"] = abs(b)
-                if b > 0:
-                    result["batteryImport"], result["batteryExport"], result["batteryLine"] = 0, b, 1
-                elif b < 0:
-                    result["batteryImport"], result["batteryExport"], result["batteryLine"] = -b, 0, 2
-                else:
-                    result["batteryImport"], result["batteryExport"], result["batteryLine"] = 0, 0, 0
-                    if result.get("batteryStatus") != 4:
-                        result["batteryStatusText"] = "Standby"
+                result["batteryPower"] = b if b >= 0 else -b
+                result["batteryImport"] = -b if b < 0 else 0
+                result["batteryExport"] = b if b > 0 else 0
+                result["batteryLine"] = 1 if b > 0 else 2 if b < 0 else 0
+                if not b and result.get("batteryStatus") != 4:
+                    result["batteryStatusText"] = "Standby"
 
         # === BATTERY SOC ===
         # Priority: battTotalSoc (addr 32) > batterySoc (addr 290)
-        soc = values.get("battTotalSoc") or values.get("batterySoc") or 0
+        soc = _first_set(values, _SOC_SOURCES)
         if 0 <= soc <= 100:
             result["batterySoc"] = soc
         else:
             result["batterySoc"] = 0
         
-        # === BATTERY SOH ===
-        result["batterySoh"] = values.get("batterySoh", 0) or 0
-        
-        # === TEMPERATURES ===
-        result["inverterTemp"] = values.get("invTemperature") or values.get("inverterTemp") or 0
-        result["dcdcTemperature"] = values.get("dcdcTemperature") or 0
-        
-        # === ENERGY STATISTICS ===
-        result["dailyPowerGeneration"] = values.get("dailyEnergyGeneration") or values.get("dailyPowerGeneration") or 0
-        result["totalPowerGeneration"] = values.get("totalEnergyGeneration") or values.get("totalPowerGeneration") or 0
-        result["dailyConsumption"] = values.get("dailyPowerConsumption") or values.get("dailyConsumption") or 0
-        result["dailyGridExport"] = values.get("dailyGridConnectionPower") or values.get("dailyGridExport") or 0
-        result["dailyBattCharge"] = values.get("dailyBattChargeEnergy") or values.get("dailyBattCharge") or 0
-        result["dailyBattDischarge"] = values.get("dailyBattDischargeEnergy") or values.get("dailyBattDischarge") or 0
-        
-        # === VOLTAGE & FREQUENCY ===
-        # Single-phase models expose gridVolt/gridFreq; three-phase models expose
-        # per-phase values instead, so fall back to phase A.
-        result["gridVoltage"] = (
-            values.get("gridVolt") or values.get("gridVoltage")
-            or values.get("phaseAgridVoltage") or 0
-        )
-        result["gridFrequency"] = (
-            values.get("gridFreq") or values.get("gridFrequency")
-            or values.get("phaseAgridFrequency") or 0
-        )
-        result["batteryVoltage"] = values.get("batteryVoltage") or 0
-        result["batteryCurrent"] = values.get("batteryCurrent") or 0
+        # === SOH, TEMPERATURES, ENERGY STATISTICS, VOLTAGE & FREQUENCY ===
+        _copy_first_set(values, result, _STATUS_FIELDS)
         
         # === SYSTEM MODE ===
         # Mode mapping from APK analysis (EnergyFlowOptimize.e() + setModeType())
@@ -629,23 +720,12 @@ class DynamicTelemetryParser:
         #
         # Register 5 (systemRunMode) = The ACTUAL mode the system is running in
         # Register 6 (systemRunStatus) = Run STATUS indicator (NOT the mode!)
-        #
-        MODE_NAMES = {
-            1: "Regular Mode",
-            4: "Emergency Mode",
-            3: "Electricity Sell Mode",
-            5: "AC Charging Off Emergency Mode",  # MQTT register 5 value 5 is NOT BEM
-            0: "Battery Priority Mode",
-            2: "Grid Priority Mode",
-            6: "PV Mode",
-            7: "Forced Off Grid Mode",
-        }
         
         # systemRunMode (register 5) is the ACTUAL mode
-        running_mode = values.get("systemRunMode") or 1
+        running_mode = get("systemRunMode") or 1
         
         # systemRunStatus (register 6) is NOT the mode - it's a status indicator
-        run_status = values.get("systemRunStatus") or 0
+        run_status = get("systemRunStatus") or 0
         
         # The display mode should be the running mode
         display_mode = running_mode
@@ -653,39 +733,36 @@ class DynamicTelemetryParser:
         result["systemRunMode"] = running_mode  # The actual mode
         result["systemRunStatus"] = run_status  # Run status (not mode)
         result["patternMode"] = running_mode    # For backwards compatibility
-        result["code"] = MODE_NAMES.get(display_mode, f"Unknown Mode ({display_mode})")
+        # Only format the fallback name for codes missing from the table
+        result["code"] = (
+            _MODE_NAMES.get(display_mode) or f"Unknown Mode ({display_mode})"
+        )
         result["_modeCode"] = display_mode
         result["_runningModeCode"] = running_mode
         
-        _LOGGER.debug("Mode: systemRunMode=%d, systemRunStatus=%d, display='%s'", 
-                     running_mode, run_status, result["code"])
+        if debug:
+            _LOGGER.debug("Mode: systemRunMode=%d, systemRunStatus=%d, display='%s'", 
+                         running_mode, run_status, result["code"])
         
         # === RATED POWER ===
-        rated = values.get("ratedPower") or 0
+        rated = get("ratedPower") or 0
         # Handle coefficient if needed
         if 10 < rated < 200:  # Likely in hundreds of watts
             result["ratedPower"] = rated * 100
         else:
             result["ratedPower"] = rated
         
-        # === METER/CT POWER ===
-        result["ct1Power"] = values.get("ct1Power") or 0
-        result["ct2Power"] = values.get("ct2Power") or 0
-        result["meterPower"] = values.get("meterPower") or 0
-        
-        # === ENERGY FLOW (app display) ===
-        result["energyFlowPv"] = values.get("energyFlowPvTotalPower") or values.get("energyFlowPv") or 0
-        result["energyFlowBatt"] = values.get("energyFlowBattPower") or values.get("energyFlowBatt") or 0
-        result["energyFlowGrid"] = values.get("energyFlowGridPower") or values.get("energyFlowGrid") or 0
-        result["energyFlowLoad"] = values.get("energyFlowLoadTotalPower") or values.get("energyFlowLoad") or 0
-        
-        _LOGGER.debug("=== PARSED VALUES ===")
-        _LOGGER.debug("PV: %dW (pv1=%d, pv2=%d)", result["pvPower"], pv1, pv2)
-        _LOGGER.debug("Grid: %dW (import=%d, export=%d)", result["gridPower"], result["gridImport"], result["gridExport"])
-        _LOGGER.debug("Battery: %dW (SOC=%d%%, status=%s)", result["batteryPower"], result["batterySoc"], result["batteryStatusText"])
-        _LOGGER.debug("Load: %dW", result["loadPower"])
-        _LOGGER.debug("Daily Gen: %.2f kWh", result["dailyPowerGeneration"])
-        _LOGGER.debug("Mode: %s (code=%d)", result["code"], result.get("_modeCode", 0))
+        # === METER/CT POWER, ENERGY FLOW (app display) ===
+        _copy_first_set(values, result, _METER_FLOW_FIELDS)
+        
+        if debug:
+            _LOGGER.debug("=== PARSED VALUES ===")
+            _LOGGER.debug("PV: %dW (pv1=%d, pv2=%d)", result["pvPower"], pv1, pv2)
+            _LOGGER.debug("Grid: %dW (import=%d, export=%d)", result["gridPower"], result["gridImport"], result["gridExport"])
+            _LOGGER.debug("Battery: %dW (SOC=%d%%, status=%s)", result["batteryPower"], result["batterySoc"], result["batteryStatusText"])
+            _LOGGER.debug("Load: %dW", result["loadPower"])
+            _LOGGER.debug("Daily Gen: %.2f kWh", result["dailyPowerGeneration"])
+            _LOGGER.debug("Mode: %s (code=%d)", result["code"], result.get("_modeCode", 0))
         
         return result
 
@@ -730,25 +807,21 @@ class ESYCommandBuilder:
             # FC 17 is used for polling
             user_id = bytes([0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFC, 0x14])
         
-        # Payload: num_ops(2) + addr(2) + count(2) + value(2)
-        payload = struct.pack(">HHHH", 
-            1,                  # 1 operation
-            register_address,   # address
-            1,                  # 1 value
-            value               # the value
+        # Header and payload in one pack; the payload is
+        # num_ops(2) + addr(2) + count(2) + value(2)
+        return _WRITE_SINGLE_CMD.pack(
+            config_id,
+            msg_id,
+            user_id,
+            0x00,                       # fun_code: write command
+            0x10,                       # source_id: from app
+            0x0800,                     # page_index: write page
+            _WRITE_SINGLE_PAYLOAD_LEN,  # data_length
+            1,                          # 1 operation
+            register_address,           # address
+            1,                          # 1 value
+            value,                      # the value
         )
-        
-        header = MsgHeader(
-            config_id=config_id,
-            msg_id=msg_id,
-            user_id=user_id,
-            fun_code=0x00,      # Write command
-            source_id=0x10,     # From app
-            page_index=0x0800,  # Write page
-            data_length=len(payload)
-        )
-
-        return header.to_bytes() + payload
 
     @staticmethod
     def build_multi_write_command(
@@ -772,15 +845,16 @@ class ESYCommandBuilder:
             # FC 17 is used for multi-register writes (confirmed from traffic analysis)
             user_id = bytes([0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFC, 0x17])
         
-        # Build payload
-        payload = struct.pack(">H", len(writes))  # num_operations
-        
+        # Build payload: num_operations, then addr, count, values per write,
+        # packed as one run of u16s
+        words = [len(writes)]
         for addr, values in writes:
             if isinstance(values, int):
                 values = [values]
-            payload += struct.pack(">HH", addr, len(values))  # addr, count
-            for val in values:
-                payload += struct.pack(">H", val)  # each value
+            words.append(addr)
+            words.append(len(values))
+            words.extend(values)
+        payload = struct.pack(f">{len(words)}H", *words)
         
         header = MsgHeader(
             config_id=config_id,
@@ -817,10 +891,7 @@ class ESYCommandBuilder:
             user_id = bytes([0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFC, 0x17])
         
         # Payload: segment count (2 bytes) + segment IDs (2 bytes each)
-        payload = bytearray()
-        payload.extend(struct.pack(">H", len(segment_ids)))  # Count
-        for seg_id in segment_ids:
-            payload.extend(struct.pack(">H", seg_id))
+        payload = struct.pack(f">{len(segment_ids) + 1}H", len(segment_ids), *segment_ids)
         
         # Header for poll request
         # fun_code = 0x20 (response/poll), source_id = 0x10, page_index = 0x0300
@@ -834,7 +905,7 @@ class ESYCommandBuilder:
             data_length=len(payload)
         )
         
-        return header.to_bytes() + bytes(payload)
+        return header.to_bytes() + payload
 
 
 # Convenience function
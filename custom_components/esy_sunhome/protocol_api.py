@@ -8,10 +8,12 @@ for all device models and firmware versions.
 import logging
 import aiohttp
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 
 from .const import (
     ESY_API_BASE_URL,
@@ -31,8 +33,11 @@ _LOGGER = logging.getLogger(__name__)
 # Cache duration for protocol definitions (24 hours)
 PROTOCOL_CACHE_DURATION = timedelta(hours=24)
 
+_PROTOCOL_LIST_URL = f"{ESY_API_BASE_URL}{ESY_API_PROTOCOL_LIST}"
+_PROTOCOL_SEGMENT_URL = f"{ESY_API_BASE_URL}{ESY_API_PROTOCOL_SEGMENT}"
 
-@dataclass
+
+@dataclass(slots=True)
 class RegisterDefinition:
     """Definition of a single Modbus register."""
     address: int
@@ -50,7 +55,7 @@ class RegisterDefinition:
         return self.data_length == 4
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentDefinition:
     """Definition of a polling segment."""
     segment_id: int
@@ -74,7 +79,11 @@ class ProtocolDefinition:
     input_registers: Dict[int, RegisterDefinition] = field(default_factory=dict)
     holding_registers: Dict[int, RegisterDefinition] = field(default_factory=dict)
     segments: List[SegmentDefinition] = field(default_factory=list)
-    fetched_at: datetime = field(default_factory=datetime.utcnow)
+    fetched_at: float = field(default_factory=time.monotonic)
+    # dataKey -> register index per function code, built on first lookup
+    _key_index: Dict[int, Tuple[int, Dict[str, RegisterDefinition]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
     def get_register(self, address: int, function_code: int = FC_READ_INPUT) -> Optional[RegisterDefinition]:
         """Get register definition by address and function code."""
@@ -94,27 +103,40 @@ class ProtocolDefinition:
         (e.g. systemRunMode is 57 on single-phase, 72 on three-phase; 57 is
         clearMeterEnergy on three-phase).
         """
-        regs = (
-            self.holding_registers
-            if function_code == FC_READ_HOLDING
-            else self.input_registers
-        )
-        for reg in regs.values():
-            if reg.data_key == data_key:
-                return reg
-        return None
+        fc = FC_READ_HOLDING if function_code == FC_READ_HOLDING else FC_READ_INPUT
+        regs = self.holding_registers if fc == FC_READ_HOLDING else self.input_registers
+
+        # The register maps are filled in after construction, so rebuild the
+        # index whenever the map size has changed since it was built.
+        cached = self._key_index.get(fc)
+        if cached is None or cached[0] != len(regs):
+            index: Dict[str, RegisterDefinition] = {}
+            for reg in regs.values():
+                # First register wins, matching a linear scan
+                index.setdefault(reg.data_key, reg)
+            cached = self._key_index[fc] = (len(regs), index)
+        return cached[1].get(data_key)
     
     def is_expired(self) -> bool:
         """Check if the cached protocol is expired."""
-        return datetime.utcnow() - self.fetched_at > PROTOCOL_CACHE_DURATION
+        return (
+            time.monotonic() - self.fetched_at
+            > PROTOCOL_CACHE_DURATION.total_seconds()
+        )
 
 
 class ProtocolAPI:
     """API client for fetching protocol definitions."""
     
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.access_token = access_token
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._auth_headers = {"Authorization": f"bearer {access_token}"}
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self._protocol_cache: Dict[str, ProtocolDefinition] = {}
     
     def _cache_key(self, pv_power: int, tp_type: int, mcu_version: int) -> str:
@@ -122,20 +144,26 @@ class ProtocolAPI:
         return f"{pv_power}_{tp_type}_{mcu_version}"
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get the injected session, or create a private one if needed."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession()
+            self._owns_session = True
         return self._session
     
     async def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session if this instance created it."""
+        if not self._owns_session:
+            return
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
     
     def update_token(self, access_token: str):
         """Update the access token."""
+        if access_token == self.access_token:
+            return
         self.access_token = access_token
+        self._auth_headers = {"Authorization": f"bearer {access_token}"}
     
     async def fetch_protocol_list(
         self,
@@ -144,13 +172,13 @@ class ProtocolAPI:
         mcu_version: int = DEFAULT_MCU_VERSION,
     ) -> Optional[Dict[str, Any]]:
         """Fetch protocol register list from API."""
-        url = f"{ESY_API_BASE_URL}{ESY_API_PROTOCOL_LIST}"
+        url = _PROTOCOL_LIST_URL
         params = {
             "pvPower": pv_power,
             "tpType": tp_type,
             "mcuVersion": mcu_version,
         }
-        headers = {"Authorization": f"bearer {self.access_token}"}
+        headers = self._auth_headers
         
         try:
             session = await self._get_session()
@@ -176,13 +204,13 @@ class ProtocolAPI:
         mcu_version: int = DEFAULT_MCU_VERSION,
     ) -> Optional[Dict[str, Any]]:
         """Fetch protocol segment definitions from API."""
-        url = f"{ESY_API_BASE_URL}{ESY_API_PROTOCOL_SEGMENT}"
+        url = _PROTOCOL_SEGMENT_URL
         params = {
             "pvPower": pv_power,
             "tpType": tp_type,
             "mcuVersion": mcu_version,
         }
-        headers = {"Authorization": f"bearer {self.access_token}"}
+        headers = self._auth_headers
         
         try:
             session = await self._get_session()
@@ -218,9 +246,15 @@ class ProtocolAPI:
             else:
                 coeff = float(coeff)
             
+            # Interned so telemetry dict lookups by the same key literal
+            # (sensors, derived values) match on identity
+            data_key = reg_data.get("dataKey", f"unknown_{primary_addr}")
+            if isinstance(data_key, str):
+                data_key = sys.intern(data_key)
+
             return RegisterDefinition(
                 address=primary_addr,
-                data_key=reg_data.get("dataKey", f"unknown_{primary_addr}"),
+                data_key=data_key,
                 data_type=reg_data.get("dataType", DATA_TYPE_UNSIGNED),
                 coefficient=coeff,
                 unit=reg_data.get("unit", ""),
@@ -408,12 +442,19 @@ class ProtocolAPI:
 _protocol_api_instance: Optional[ProtocolAPI] = None
 
 
-def get_protocol_api(access_token: str) -> ProtocolAPI:
-    """Get or create the protocol API instance."""
+def get_protocol_api(
+    access_token: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> ProtocolAPI:
+    """Get or create the protocol API instance.
+
+    Passing a session (e.g. Home Assistant's shared client session) avoids
+    leaving a private session open for the lifetime of the process.
+    """
     global _protocol_api_instance
     
     if _protocol_api_instance is None:
-        _protocol_api_instance = ProtocolAPI(access_token)
+        _protocol_api_instance = ProtocolAPI(access_token, session=session)
     else:
         _protocol_api_instance.update_token(access_token)
     
@@ -1,11 +1,13 @@
 """ESY Sunhome sensor platform with comprehensive sensors."""
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -68,6 +70,244 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class EsySensorEntityDescription(SensorEntityDescription):
+    """Describes an ESY Sunhome sensor."""
+
+    data_key: str  # Key in the parsed telemetry
+
+
+def _power(
+    translation_key: str, data_key: str, icon: str, *, enabled: bool = True
+) -> EsySensorEntityDescription:
+    """Describe a power sensor in watts."""
+    return EsySensorEntityDescription(
+        key=translation_key,
+        translation_key=translation_key,
+        data_key=data_key,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=icon,
+        entity_registry_enabled_default=enabled,
+    )
+
+
+def _energy(
+    translation_key: str,
+    data_key: str,
+    icon: str,
+    *,
+    state_class: SensorStateClass = SensorStateClass.TOTAL_INCREASING,
+) -> EsySensorEntityDescription:
+    """Describe an energy sensor in kWh."""
+    return EsySensorEntityDescription(
+        key=translation_key,
+        translation_key=translation_key,
+        data_key=data_key,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=state_class,
+        icon=icon,
+    )
+
+
+def _voltage(
+    translation_key: str, data_key: str, icon: str, *, enabled: bool = True
+) -> EsySensorEntityDescription:
+    """Describe a voltage sensor in volts."""
+    return EsySensorEntityDescription(
+        key=translation_key,
+        translation_key=translation_key,
+        data_key=data_key,
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=icon,
+        entity_registry_enabled_default=enabled,
+    )
+
+
+def _current(
+    translation_key: str, data_key: str, icon: str, *, enabled: bool = True
+) -> EsySensorEntityDescription:
+    """Describe a current sensor in amps."""
+    return EsySensorEntityDescription(
+        key=translation_key,
+        translation_key=translation_key,
+        data_key=data_key,
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=icon,
+        entity_registry_enabled_default=enabled,
+    )
+
+
+def _temperature(
+    translation_key: str, data_key: str, icon: str, *, enabled: bool = True
+) -> EsySensorEntityDescription:
+    """Describe a temperature sensor in degrees Celsius."""
+    return EsySensorEntityDescription(
+        key=translation_key,
+        translation_key=translation_key,
+        data_key=data_key,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon=icon,
+        entity_registry_enabled_default=enabled,
+    )
+
+
+SENSORS: tuple[EsySensorEntityDescription, ...] = (
+    # === CORE POWER ===
+    EsySensorEntityDescription(
+        key=ATTR_SOC,
+        translation_key=ATTR_SOC,
+        data_key="batterySoc",
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:battery",
+    ),
+    _power(ATTR_PV_POWER, "pvPower", "mdi:solar-power-variant"),
+    _power(ATTR_PV1_POWER, "pv1Power", "mdi:solar-panel", enabled=False),
+    _power(ATTR_PV2_POWER, "pv2Power", "mdi:solar-panel", enabled=False),
+    _power("dc_pv_power", "dcPvPower", "mdi:solar-panel", enabled=False),
+    _power("ac_pv_power", "acPvPower", "mdi:solar-panel-large", enabled=False),
+    _power(ATTR_GRID_POWER, "gridPower", "mdi:transmission-tower"),
+    _power(ATTR_LOAD_POWER, "loadPower", "mdi:home-lightning-bolt"),
+    _power(ATTR_BATTERY_POWER, "batteryPower", "mdi:battery-charging"),
+
+    # === DIRECTIONAL POWER ===
+    _power(ATTR_BATTERY_IMPORT, "batteryImport", "mdi:battery-arrow-up"),
+    _power(ATTR_BATTERY_EXPORT, "batteryExport", "mdi:battery-arrow-down"),
+    _power(ATTR_GRID_IMPORT, "gridImport", "mdi:transmission-tower-import"),
+    _power(ATTR_GRID_EXPORT, "gridExport", "mdi:transmission-tower-export"),
+
+    # === DAILY ENERGY ===
+    _energy(
+        ATTR_DAILY_POWER_GEN, "dailyPowerGeneration", "mdi:solar-power",
+        state_class=SensorStateClass.TOTAL,
+    ),
+    _energy(
+        ATTR_DAILY_CONSUMPTION, "dailyConsumption", "mdi:home-lightning-bolt-outline",
+        state_class=SensorStateClass.TOTAL,
+    ),
+    _energy(
+        ATTR_DAILY_GRID_EXPORT, "dailyGridExport", "mdi:transmission-tower-export",
+        state_class=SensorStateClass.TOTAL,
+    ),
+    _energy(
+        ATTR_DAILY_BATT_CHARGE, "dailyBattCharge", "mdi:battery-plus",
+        state_class=SensorStateClass.TOTAL,
+    ),
+    _energy(
+        ATTR_DAILY_BATT_DISCHARGE, "dailyBattDischarge", "mdi:battery-minus",
+        state_class=SensorStateClass.TOTAL,
+    ),
+
+    # === TOTAL ENERGY ===
+    _energy(ATTR_TOTAL_POWER_GEN, "totalPowerGeneration", "mdi:counter"),
+
+    # === VOLTAGE & CURRENT ===
+    _voltage(ATTR_GRID_VOLTAGE, "gridVoltage", "mdi:flash"),
+    EsySensorEntityDescription(
+        key=ATTR_GRID_FREQUENCY,
+        translation_key=ATTR_GRID_FREQUENCY,
+        data_key="gridFrequency",
+        device_class=SensorDeviceClass.FREQUENCY,
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:sine-wave",
+    ),
+    _voltage(ATTR_PV1_VOLTAGE, "pv1Voltage", "mdi:solar-panel", enabled=False),
+    _current(ATTR_PV1_CURRENT, "pv1Current", "mdi:solar-panel", enabled=False),
+    _voltage(ATTR_PV2_VOLTAGE, "pv2Voltage", "mdi:solar-panel", enabled=False),
+    _current(ATTR_PV2_CURRENT, "pv2Current", "mdi:solar-panel", enabled=False),
+    _voltage(ATTR_BATTERY_VOLTAGE, "batteryVoltage", "mdi:battery", enabled=False),
+    _current(ATTR_BATTERY_CURRENT, "batteryCurrent", "mdi:battery", enabled=False),
+
+    # === TEMPERATURE ===
+    _temperature(ATTR_INVERTER_TEMP, "inverterTemp", "mdi:thermometer"),
+    _temperature(ATTR_DCDC_TEMP, "dcdcTemperature", "mdi:thermometer", enabled=False),
+
+    # === BATTERY HEALTH ===
+    EsySensorEntityDescription(
+        key=ATTR_BATTERY_SOH,
+        translation_key=ATTR_BATTERY_SOH,
+        data_key="batterySoh",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:battery-heart",
+        entity_registry_enabled_default=False,
+    ),
+    EsySensorEntityDescription(
+        key=ATTR_BATTERY_STATUS_TEXT,
+        translation_key=ATTR_BATTERY_STATUS_TEXT,
+        data_key="batteryStatusText",
+        device_class=SensorDeviceClass.ENUM,
+        icon="mdi:battery-clock",
+        options=[
+            "Standby", "Charging", "Charge Topping", "Float Charge",
+            "Full", "Discharging", "Unknown",
+        ],
+    ),
+    EsySensorEntityDescription(
+        key="battery_status_code",
+        translation_key="battery_status_code",
+        data_key="batteryStatus",
+        icon="mdi:battery-sync",
+        entity_registry_enabled_default=False,
+    ),
+
+    # === CT/METER POWER ===
+    _power(ATTR_CT1_POWER, "ct1Power", "mdi:current-ac", enabled=False),
+    _power(ATTR_CT2_POWER, "ct2Power", "mdi:current-ac", enabled=False),
+    _power(ATTR_METER_POWER, "meterPower", "mdi:meter-electric", enabled=False),
+
+    # === ENERGY FLOW (App Display) ===
+    _power(ATTR_ENERGY_FLOW_PV, "energyFlowPv", "mdi:solar-power", enabled=False),
+    _power(
+        ATTR_ENERGY_FLOW_BATT, "energyFlowBatt", "mdi:battery-outline",
+        enabled=False,
+    ),
+    _power(
+        ATTR_ENERGY_FLOW_GRID, "energyFlowGrid", "mdi:transmission-tower",
+        enabled=False,
+    ),
+    _power(
+        ATTR_ENERGY_FLOW_LOAD, "energyFlowLoad", "mdi:home-lightning-bolt",
+        enabled=False,
+    ),
+
+    # === SYSTEM INFO ===
+    _power(ATTR_RATED_POWER, "ratedPower", "mdi:lightning-bolt", enabled=False),
+    EsySensorEntityDescription(
+        key="baseOperatingMode",
+        translation_key="baseOperatingMode",
+        data_key=ATTR_SCHEDULE_MODE,
+        icon="mdi:battery-sync-outline",
+    ),
+    EsySensorEntityDescription(
+        key=ATTR_SYSTEM_RUN_MODE,
+        translation_key=ATTR_SYSTEM_RUN_MODE,
+        data_key="systemRunMode",
+        icon="mdi:cog",
+        entity_registry_enabled_default=False,
+    ),
+    EsySensorEntityDescription(
+        key=ATTR_SYSTEM_RUN_STATUS,
+        translation_key=ATTR_SYSTEM_RUN_STATUS,
+        data_key="systemRunStatus",
+        icon="mdi:information",
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -75,498 +315,41 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     entities = [
-        # === CORE POWER SENSORS ===
-        StateOfChargeSensor(coordinator=entry.runtime_data),
-        PvPowerSensor(coordinator=entry.runtime_data),
-        Pv1PowerSensor(coordinator=entry.runtime_data),
-        Pv2PowerSensor(coordinator=entry.runtime_data),
-        DcPvPowerSensor(coordinator=entry.runtime_data),
-        AcPvPowerSensor(coordinator=entry.runtime_data),
-        GridPowerSensor(coordinator=entry.runtime_data),
-        LoadPowerSensor(coordinator=entry.runtime_data),
-        BatteryPowerSensor(coordinator=entry.runtime_data),
-        
-        # === DIRECTIONAL POWER ===
-        BatteryImportSensor(coordinator=entry.runtime_data),
-        BatteryExportSensor(coordinator=entry.runtime_data),
-        GridImportSensor(coordinator=entry.runtime_data),
-        GridExportSensor(coordinator=entry.runtime_data),
-        
-        # === DAILY ENERGY ===
-        DailyPowerGenSensor(coordinator=entry.runtime_data),
-        DailyConsumptionSensor(coordinator=entry.runtime_data),
-        DailyGridExportSensor(coordinator=entry.runtime_data),
-        DailyBattChargeSensor(coordinator=entry.runtime_data),
-        DailyBattDischargeSensor(coordinator=entry.runtime_data),
-        
-        # === TOTAL ENERGY ===
-        TotalPowerGenSensor(coordinator=entry.runtime_data),
-        
-        # === VOLTAGE & CURRENT ===
-        GridVoltageSensor(coordinator=entry.runtime_data),
-        GridFrequencySensor(coordinator=entry.runtime_data),
-        Pv1VoltageSensor(coordinator=entry.runtime_data),
-        Pv1CurrentSensor(coordinator=entry.runtime_data),
-        Pv2VoltageSensor(coordinator=entry.runtime_data),
-        Pv2CurrentSensor(coordinator=entry.runtime_data),
-        BatteryVoltageSensor(coordinator=entry.runtime_data),
-        BatteryCurrentSensor(coordinator=entry.runtime_data),
-        
-        # === TEMPERATURE ===
-        InverterTempSensor(coordinator=entry.runtime_data),
-        DcdcTempSensor(coordinator=entry.runtime_data),
-        
-        # === BATTERY HEALTH ===
-        BatterySohSensor(coordinator=entry.runtime_data),
-        BatteryStatusTextSensor(coordinator=entry.runtime_data),
-        BatteryStatusCodeSensor(coordinator=entry.runtime_data),
-        
-        # === CT/METER POWER ===
-        Ct1PowerSensor(coordinator=entry.runtime_data),
-        Ct2PowerSensor(coordinator=entry.runtime_data),
-        MeterPowerSensor(coordinator=entry.runtime_data),
-        
-        # === ENERGY FLOW (App Display) ===
-        EnergyFlowPvSensor(coordinator=entry.runtime_data),
-        EnergyFlowBattSensor(coordinator=entry.runtime_data),
-        EnergyFlowGridSensor(coordinator=entry.runtime_data),
-        EnergyFlowLoadSensor(coordinator=entry.runtime_data),
-        
-        # === SYSTEM INFO ===
-        RatedPowerSensor(coordinator=entry.runtime_data),
-        BaseOperatingModeSensor(coordinator=entry.runtime_data),
-        SystemModeSensor(coordinator=entry.runtime_data),
-        SystemStatusSensor(coordinator=entry.runtime_data),
+        EsySensor(coordinator=entry.runtime_data, description=description)
+        for description in SENSORS
     ]
     
     async_add_entities(entities)
     _LOGGER.info("Added %d ESY Sunhome sensors", len(entities))
 
 
-class EsySensorBase(EsySunhomeEntity, SensorEntity):
-    """Base class for ESY Sunhome sensors."""
+class EsySensor(EsySunhomeEntity, SensorEntity):
+    """ESY Sunhome sensor backed by one telemetry key."""
+
+    entity_description: EsySensorEntityDescription
+    # (value, available) as of the last state write
+    _last_written: tuple | None = None
 
-    _attr_key: str = ""
+    def __init__(
+        self, coordinator, description: EsySensorEntityDescription
+    ) -> None:
+        """Initialize the sensor from its description."""
+        self.entity_description = description
+        super().__init__(coordinator)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and hasattr(self.coordinator.data, self._attr_key):
-            self._attr_native_value = getattr(self.coordinator.data, self._attr_key, None)
-        elif self.coordinator.data and isinstance(self.coordinator.data, dict):
-            self._attr_native_value = self.coordinator.data.get(self._attr_key)
+        # TelemetryData and plain dicts both expose get(); one lookup
+        # replaces the hasattr/getattr pair through __getattr__
+        data = self.coordinator.data
+        if data:
+            self._attr_native_value = data.get(self.entity_description.data_key)
+
+        # Most sensors repeat their value on every push; only write state
+        # when the value or availability actually changed
+        written = (self._attr_native_value, self.available)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
-
-
-# =============================================================================
-# CORE POWER SENSORS
-# =============================================================================
-
-class StateOfChargeSensor(EsySensorBase):
-    """Battery State of Charge."""
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.BATTERY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_translation_key = ATTR_SOC
-    _attr_key = "batterySoc"
-    _attr_icon = "mdi:battery"
-
-
-class EsyPowerSensor(EsySensorBase):
-    """Base class for power sensors."""
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-
-class PvPowerSensor(EsyPowerSensor):
-    """Total PV Power."""
-    _attr_translation_key = ATTR_PV_POWER
-    _attr_key = "pvPower"
-    _attr_icon = "mdi:solar-power-variant"
-
-
-class Pv1PowerSensor(EsyPowerSensor):
-    """PV String 1 Power."""
-    _attr_translation_key = ATTR_PV1_POWER
-    _attr_key = "pv1Power"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class Pv2PowerSensor(EsyPowerSensor):
-    """PV String 2 Power."""
-    _attr_translation_key = ATTR_PV2_POWER
-    _attr_key = "pv2Power"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class DcPvPowerSensor(EsyPowerSensor):
-    """DC PV Power (ESY PV - panels connected to inverter DC inputs)."""
-    _attr_translation_key = "dc_pv_power"
-    _attr_key = "dcPvPower"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class AcPvPowerSensor(EsyPowerSensor):
-    """AC PV Power (AC-coupled solar measured by CT2)."""
-    _attr_translation_key = "ac_pv_power"
-    _attr_key = "acPvPower"
-    _attr_icon = "mdi:solar-panel-large"
-    _attr_entity_registry_enabled_default = False
-
-
-class GridPowerSensor(EsyPowerSensor):
-    """Grid Power (+ import, - export)."""
-    _attr_translation_key = ATTR_GRID_POWER
-    _attr_key = "gridPower"
-    _attr_icon = "mdi:transmission-tower"
-
-
-class LoadPowerSensor(EsyPowerSensor):
-    """Load/Consumption Power."""
-    _attr_translation_key = ATTR_LOAD_POWER
-    _attr_key = "loadPower"
-    _attr_icon = "mdi:home-lightning-bolt"
-
-
-class BatteryPowerSensor(EsyPowerSensor):
-    """Battery Power (+ charging, - discharging)."""
-    _attr_translation_key = ATTR_BATTERY_POWER
-    _attr_key = "batteryPower"
-    _attr_icon = "mdi:battery-charging"
-
-
-# =============================================================================
-# DIRECTIONAL POWER SENSORS
-# =============================================================================
-
-class BatteryImportSensor(EsyPowerSensor):
-    """Battery Charging Power."""
-    _attr_translation_key = ATTR_BATTERY_IMPORT
-    _attr_key = "batteryImport"
-    _attr_icon = "mdi:battery-arrow-up"
-
-
-class BatteryExportSensor(EsyPowerSensor):
-    """Battery Discharging Power."""
-    _attr_translation_key = ATTR_BATTERY_EXPORT
-    _attr_key = "batteryExport"
-    _attr_icon = "mdi:battery-arrow-down"
-
-
-class GridImportSensor(EsyPowerSensor):
-    """Grid Import Power."""
-    _attr_translation_key = ATTR_GRID_IMPORT
-    _attr_key = "gridImport"
-    _attr_icon = "mdi:transmission-tower-import"
-
-
-class GridExportSensor(EsyPowerSensor):
-    """Grid Export Power."""
-    _attr_translation_key = ATTR_GRID_EXPORT
-    _attr_key = "gridExport"
-    _attr_icon = "mdi:transmission-tower-export"
-
-
-# =============================================================================
-# ENERGY SENSORS (kWh)
-# =============================================================================
-
-class EsyEnergySensor(EsySensorBase):
-    """Base class for energy sensors."""
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-
-class DailyPowerGenSensor(EsyEnergySensor):
-    """Daily Power Generation."""
-    _attr_translation_key = ATTR_DAILY_POWER_GEN
-    _attr_key = "dailyPowerGeneration"
-    _attr_icon = "mdi:solar-power"
-    _attr_state_class = SensorStateClass.TOTAL
-
-
-class DailyConsumptionSensor(EsyEnergySensor):
-    """Daily Power Consumption."""
-    _attr_translation_key = ATTR_DAILY_CONSUMPTION
-    _attr_key = "dailyConsumption"
-    _attr_icon = "mdi:home-lightning-bolt-outline"
-    _attr_state_class = SensorStateClass.TOTAL
-
-
-class DailyGridExportSensor(EsyEnergySensor):
-    """Daily Grid Export."""
-    _attr_translation_key = ATTR_DAILY_GRID_EXPORT
-    _attr_key = "dailyGridExport"
-    _attr_icon = "mdi:transmission-tower-export"
-    _attr_state_class = SensorStateClass.TOTAL
-
-
-class DailyBattChargeSensor(EsyEnergySensor):
-    """Daily Battery Charge Energy."""
-    _attr_translation_key = ATTR_DAILY_BATT_CHARGE
-    _attr_key = "dailyBattCharge"
-    _attr_icon = "mdi:battery-plus"
-    _attr_state_class = SensorStateClass.TOTAL
-
-
-class DailyBattDischargeSensor(EsyEnergySensor):
-    """Daily Battery Discharge Energy."""
-    _attr_translation_key = ATTR_DAILY_BATT_DISCHARGE
-    _attr_key = "dailyBattDischarge"
-    _attr_icon = "mdi:battery-minus"
-    _attr_state_class = SensorStateClass.TOTAL
-
-
-class TotalPowerGenSensor(EsyEnergySensor):
-    """Total Power Generation."""
-    _attr_translation_key = ATTR_TOTAL_POWER_GEN
-    _attr_key = "totalPowerGeneration"
-    _attr_icon = "mdi:counter"
-
-
-# =============================================================================
-# VOLTAGE & CURRENT SENSORS
-# =============================================================================
-
-class EsyVoltageSensor(EsySensorBase):
-    """Base class for voltage sensors."""
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-
-class EsyCurrentSensor(EsySensorBase):
-    """Base class for current sensors."""
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-
-class GridVoltageSensor(EsyVoltageSensor):
-    """Grid Voltage."""
-    _attr_translation_key = ATTR_GRID_VOLTAGE
-    _attr_key = "gridVoltage"
-    _attr_icon = "mdi:flash"
-
-
-class GridFrequencySensor(EsySensorBase):
-    """Grid Frequency."""
-    _attr_device_class = SensorDeviceClass.FREQUENCY
-    _attr_native_unit_of_measurement = UnitOfFrequency.HERTZ
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_translation_key = ATTR_GRID_FREQUENCY
-    _attr_key = "gridFrequency"
-    _attr_icon = "mdi:sine-wave"
-
-
-class Pv1VoltageSensor(EsyVoltageSensor):
-    """PV String 1 Voltage."""
-    _attr_translation_key = ATTR_PV1_VOLTAGE
-    _attr_key = "pv1Voltage"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class Pv1CurrentSensor(EsyCurrentSensor):
-    """PV String 1 Current."""
-    _attr_translation_key = ATTR_PV1_CURRENT
-    _attr_key = "pv1Current"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class Pv2VoltageSensor(EsyVoltageSensor):
-    """PV String 2 Voltage."""
-    _attr_translation_key = ATTR_PV2_VOLTAGE
-    _attr_key = "pv2Voltage"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class Pv2CurrentSensor(EsyCurrentSensor):
-    """PV String 2 Current."""
-    _attr_translation_key = ATTR_PV2_CURRENT
-    _attr_key = "pv2Current"
-    _attr_icon = "mdi:solar-panel"
-    _attr_entity_registry_enabled_default = False
-
-
-class BatteryVoltageSensor(EsyVoltageSensor):
-    """Battery Voltage."""
-    _attr_translation_key = ATTR_BATTERY_VOLTAGE
-    _attr_key = "batteryVoltage"
-    _attr_icon = "mdi:battery"
-    _attr_entity_registry_enabled_default = False
-
-
-class BatteryCurrentSensor(EsyCurrentSensor):
-    """Battery Current."""
-    _attr_translation_key = ATTR_BATTERY_CURRENT
-    _attr_key = "batteryCurrent"
-    _attr_icon = "mdi:battery"
-    _attr_entity_registry_enabled_default = False
-
-
-# =============================================================================
-# TEMPERATURE SENSORS
-# =============================================================================
-
-class EsyTempSensor(EsySensorBase):
-    """Base class for temperature sensors."""
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-
-class InverterTempSensor(EsyTempSensor):
-    """Inverter Temperature."""
-    _attr_translation_key = ATTR_INVERTER_TEMP
-    _attr_key = "inverterTemp"
-    _attr_icon = "mdi:thermometer"
-
-
-class DcdcTempSensor(EsyTempSensor):
-    """DC-DC Converter Temperature."""
-    _attr_translation_key = ATTR_DCDC_TEMP
-    _attr_key = "dcdcTemperature"
-    _attr_icon = "mdi:thermometer"
-    _attr_entity_registry_enabled_default = False
-
-
-# =============================================================================
-# BATTERY HEALTH SENSORS
-# =============================================================================
-
-class BatterySohSensor(EsySensorBase):
-    """Battery State of Health."""
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_translation_key = ATTR_BATTERY_SOH
-    _attr_key = "batterySoh"
-    _attr_icon = "mdi:battery-heart"
-    _attr_entity_registry_enabled_default = False
-
-
-class BatteryStatusTextSensor(EsySensorBase):
-    """Battery Status Text."""
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_translation_key = ATTR_BATTERY_STATUS_TEXT
-    _attr_key = "batteryStatusText"
-    _attr_icon = "mdi:battery-clock"
-    _attr_options = ["Standby", "Charging", "Charge Topping", "Float Charge", "Full", "Discharging", "Unknown"]
-
-
-class BatteryStatusCodeSensor(EsySensorBase):
-    """Battery Status Code (0=Standby, 1=Charging, 2=Charge Topping, 3=Float Charge, 4=Full, 5=Discharging)."""
-    _attr_translation_key = "battery_status_code"
-    _attr_key = "batteryStatus"
-    _attr_icon = "mdi:battery-sync"
-    _attr_entity_registry_enabled_default = False
-
-
-# =============================================================================
-# CT/METER SENSORS
-# =============================================================================
-
-class Ct1PowerSensor(EsyPowerSensor):
-    """CT1 Power (Grid Meter)."""
-    _attr_translation_key = ATTR_CT1_POWER
-    _attr_key = "ct1Power"
-    _attr_icon = "mdi:current-ac"
-    _attr_entity_registry_enabled_default = False
-
-
-class Ct2PowerSensor(EsyPowerSensor):
-    """CT2 Power."""
-    _attr_translation_key = ATTR_CT2_POWER
-    _attr_key = "ct2Power"
-    _attr_icon = "mdi:current-ac"
-    _attr_entity_registry_enabled_default = False
-
-
-class MeterPowerSensor(EsyPowerSensor):
-    """Smart Meter Power."""
-    _attr_translation_key = ATTR_METER_POWER
-    _attr_key = "meterPower"
-    _attr_icon = "mdi:meter-electric"
-    _attr_entity_registry_enabled_default = False
-
-
-# =============================================================================
-# ENERGY FLOW SENSORS (App Display)
-# =============================================================================
-
-class EnergyFlowPvSensor(EsyPowerSensor):
-    """Energy Flow - PV (App Display)."""
-    _attr_translation_key = ATTR_ENERGY_FLOW_PV
-    _attr_key = "energyFlowPv"
-    _attr_icon = "mdi:solar-power"
-    _attr_entity_registry_enabled_default = False
-
-
-class EnergyFlowBattSensor(EsyPowerSensor):
-    """Energy Flow - Battery (App Display)."""
-    _attr_translation_key = ATTR_ENERGY_FLOW_BATT
-    _attr_key = "energyFlowBatt"
-    _attr_icon = "mdi:battery-outline"
-    _attr_entity_registry_enabled_default = False
-
-
-class EnergyFlowGridSensor(EsyPowerSensor):
-    """Energy Flow - Grid (App Display)."""
-    _attr_translation_key = ATTR_ENERGY_FLOW_GRID
-    _attr_key = "energyFlowGrid"
-    _attr_icon = "mdi:transmission-tower"
-    _attr_entity_registry_enabled_default = False
-
-
-class EnergyFlowLoadSensor(EsyPowerSensor):
-    """Energy Flow - Load (App Display)."""
-    _attr_translation_key = ATTR_ENERGY_FLOW_LOAD
-    _attr_key = "energyFlowLoad"
-    _attr_icon = "mdi:home-lightning-bolt"
-    _attr_entity_registry_enabled_default = False
-
-
-# =============================================================================
-# SYSTEM INFO SENSORS
-# =============================================================================
-
-class RatedPowerSensor(EsyPowerSensor):
-    """Inverter Rated Power."""
-    _attr_translation_key = ATTR_RATED_POWER
-    _attr_key = "ratedPower"
-    _attr_icon = "mdi:lightning-bolt"
-    _attr_entity_registry_enabled_default = False
-
-
-class BaseOperatingModeSensor(EsySensorBase):
-    """Current base operating mode from MQTT (human-readable name).
-    Always shows the actual mode the inverter is running, even when
-    BEM is active (unlike the Operating Mode select which becomes unavailable).
-    """
-    _attr_translation_key = "baseOperatingMode"
-    _attr_name = "Base Operating Mode"
-    _attr_key = ATTR_SCHEDULE_MODE
-    _attr_icon = "mdi:battery-sync-outline"
-
-
-class SystemModeSensor(EsySensorBase):
-    """System Run Mode (raw register value)."""
-    _attr_translation_key = ATTR_SYSTEM_RUN_MODE
-    _attr_key = "systemRunMode"
-    _attr_icon = "mdi:cog"
-    _attr_entity_registry_enabled_default = False
-
-
-class SystemStatusSensor(EsySensorBase):
-    """System Run Status."""
-    _attr_translation_key = ATTR_SYSTEM_RUN_STATUS
-    _attr_key = "systemRunStatus"
-    _attr_icon = "mdi:information"
-    _attr_entity_registry_enabled_default = False
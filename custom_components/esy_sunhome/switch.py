@@ -42,28 +42,48 @@ class ESYSunhomePollingSwitch(EsySunhomeEntity, SwitchEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_api_polling"
         self._attr_entity_registry_enabled_default = True
+        self._is_on = entry.options.get(CONF_ENABLE_POLLING, DEFAULT_ENABLE_POLLING)
+
+    async def async_added_to_hass(self) -> None:
+        """Track option changes made outside this switch (e.g. options flow)."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._entry.add_update_listener(self._async_options_updated)
+        )
+
+    async def _async_options_updated(
+        self, hass: HomeAssistant, entry: ConfigEntry
+    ) -> None:
+        """Refresh the cached state after the entry options change."""
+        is_on = entry.options.get(CONF_ENABLE_POLLING, DEFAULT_ENABLE_POLLING)
+        if is_on != self._is_on:
+            self._is_on = is_on
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return true if polling is enabled."""
-        return self._entry.options.get(CONF_ENABLE_POLLING, DEFAULT_ENABLE_POLLING)
+        return self._is_on
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on polling."""
-        self.hass.config_entries.async_update_entry(
-            self._entry,
-            options={**self._entry.options, CONF_ENABLE_POLLING: True},
-        )
-        self.coordinator.set_polling_enabled(True)
-        self.async_write_ha_state()
+        self._set_polling(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off polling."""
+        self._set_polling(False)
+
+    def _set_polling(self, enabled: bool) -> None:
+        """Persist the polling option and apply it to the coordinator."""
+        # A repeated toggle would only rewrite identical options to storage
+        if enabled == self._is_on:
+            return
         self.hass.config_entries.async_update_entry(
             self._entry,
-            options={**self._entry.options, CONF_ENABLE_POLLING: False},
+            options=self._entry.options | {CONF_ENABLE_POLLING: enabled},
         )
-        self.coordinator.set_polling_enabled(False)
+        self._is_on = enabled
+        self.coordinator.set_polling_enabled(enabled)
         self.async_write_ha_state()
 
 
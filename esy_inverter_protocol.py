@@ -13,9 +13,11 @@ MQTT Brokers (Only the international one will be used):
 """
 
 import struct
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Tuple, Union
 from enum import IntEnum
+from types import MappingProxyType
 from decimal import Decimal
 
 
@@ -28,6 +30,42 @@ MQTT_BROKER_DOMESTIC = "tcp://120.79.138.205:1883"
 
 HEADER_SIZE = 24  # 0x18 bytes
 
+# configId, msgId, userId, funCode, sourceId, pageIndex, 3 reserved, dataLength
+_HDR = struct.Struct('>II8sBBB3xH')
+
+# Single register codecs
+_U16 = struct.Struct('>H')
+_I16 = struct.Struct('>h')
+_U32 = struct.Struct('>I')
+_I32 = struct.Struct('>i')
+
+# Write command payload: register address, value
+_U16_PAIR = struct.Struct('>HH')
+
+# Offsets of the per-command fields within a serialized MsgHeader
+_MSG_ID_OFFSET = 4
+_DATA_LENGTH_OFFSET = 22
+
+# segmentId, segmentType, segmentAddress, paramsNum
+_SEG_HDR = struct.Struct('>HHHH')
+
+# Bulk register decoders, built once per register count
+_U16_STRUCTS: Dict[int, struct.Struct] = {}
+_I16_STRUCTS: Dict[int, struct.Struct] = {}
+
+# "reg_{address}" key tuples, built once per (start address, count)
+_REG_KEYS: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+
+
+def _register_keys(base_address: int, count: int) -> Tuple[str, ...]:
+    """Return the reg_* keys for a run of registers, cached per layout"""
+    keys = _REG_KEYS.get((base_address, count))
+    if keys is None:
+        keys = _REG_KEYS[(base_address, count)] = tuple(
+            f"reg_{base_address + i}" for i in range(count)
+        )
+    return keys
+
 
 class FunctionCode(IntEnum):
     """MQTT message function codes"""
@@ -71,7 +109,7 @@ def bytes_to_int32_be(data: bytes) -> int:
     if len(data) < 4:
         return 0
     # bytes[3] | (bytes[2] << 8) | (bytes[1] << 16) | (bytes[0] << 24)
-    return struct.unpack('>i', data[:4])[0]
+    return _I32.unpack_from(data)[0]
 
 
 def bytes_to_uint32_be(data: bytes) -> int:
@@ -81,11 +119,7 @@ def bytes_to_uint32_be(data: bytes) -> int:
     """
     if len(data) < 4:
         return 0
-    b0 = data[0] & 0xFF
-    b1 = data[1] & 0xFF
-    b2 = data[2] & 0xFF
-    b3 = data[3] & 0xFF
-    return (b3) | (b2 << 8) | (b1 << 16) | (b0 << 24)
+    return _U32.unpack_from(data)[0]
 
 
 def bytes_to_int32_be_alt(data: bytes) -> int:
@@ -95,7 +129,7 @@ def bytes_to_int32_be_alt(data: bytes) -> int:
     """
     if len(data) < 4:
         return 0
-    return struct.unpack('>i', data[:4])[0]
+    return _I32.unpack_from(data)[0]
 
 
 def bytes_to_uint16_be(b0: int, b1: int) -> int:
@@ -126,25 +160,10 @@ def parse_bytes_with_type(data: bytes, data_type: Optional[str] = None) -> int:
         data: byte array (2 or 4 bytes)
         data_type: "signed", "unsigned", or None
     """
-    if data_type is None:
-        if len(data) == 2:
-            return bytes_to_int16_be(data[0], data[1])
-        elif len(data) == 4:
-            return bytes_to_int32_be_alt(data)
+    if len(data) not in (2, 4) or data_type not in (None, "signed", "unsigned"):
         return 0
-    
-    if data_type == "unsigned":
-        if len(data) == 2:
-            return bytes_to_uint16_be(data[0], data[1])
-        elif len(data) == 4:
-            return bytes_to_uint32_be(data)
-    elif data_type == "signed":
-        if len(data) == 2:
-            return bytes_to_int16_be(data[0], data[1])
-        elif len(data) == 4:
-            return bytes_to_int32_be_alt(data)
-    
-    return 0
+    # No type means signed, as in the app
+    return int.from_bytes(data, 'big', signed=data_type != "unsigned")
 
 
 def int32_to_bytes_be(value: int) -> bytes:
@@ -152,7 +171,7 @@ def int32_to_bytes_be(value: int) -> bytes:
     Convert 32-bit integer to 4 bytes (big-endian)
     Equivalent to ByteIntUtils.i(I)[B
     """
-    return struct.pack('>i', value)
+    return _I32.pack(value)
 
 
 def int16_to_bytes_be(value: int) -> bytes:
@@ -160,7 +179,7 @@ def int16_to_bytes_be(value: int) -> bytes:
     Convert 16-bit integer to 2 bytes (big-endian)
     Equivalent to ByteIntUtils.k(I)[B
     """
-    return bytes([(value >> 8) & 0xFF, value & 0xFF])
+    return _U16.pack(value & 0xFFFF)
 
 
 def user_id_to_bytes(user_id: str) -> bytes:
@@ -168,34 +187,22 @@ def user_id_to_bytes(user_id: str) -> bytes:
     Convert user ID string to 8-byte array
     Equivalent to ByteIntUtils.g(Ljava/lang/String;)[B
     """
-    result = bytearray(8)
     if not user_id or not user_id.isdigit():
-        return bytes(result)
+        return bytes(8)
     
     try:
-        value = int(user_id)
-        binary = bin(value)[2:]  # Remove '0b' prefix
-        # Pad to multiple of 8 bits
-        padding = (8 - len(binary) % 8) % 8
-        binary = '0' * padding + binary
-        
-        # Convert to bytes (fill from end)
-        byte_count = len(binary) // 8
-        for i in range(byte_count):
-            start = i * 8
-            end = start + 8
-            result[7 - (byte_count - 1 - i)] = int(binary[start:end], 2)
-    except (ValueError, OverflowError):
-        pass
-    
-    return bytes(result)
+        # Right-aligned big-endian, zero padded on the left; IDs wider than
+        # 64 bits keep their low 8 bytes, as the original byte loop did
+        return (int(user_id) & 0xFFFFFFFFFFFFFFFF).to_bytes(8, 'big')
+    except ValueError:
+        return bytes(8)
 
 
 # =============================================================================
 # MESSAGE HEADER (from MsgHeaderBean.smali and MqttUtils.smali)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MsgHeader:
     """
     MQTT message header structure (24 bytes)
@@ -213,7 +220,7 @@ class MsgHeader:
     """
     config_id: int = 0
     msg_id: int = 0
-    user_id: bytes = field(default_factory=lambda: bytes(8))
+    user_id: bytes = bytes(8)
     fun_code: int = 0
     source_id: int = 0
     page_index: int = 0
@@ -228,33 +235,16 @@ class MsgHeader:
         if data is None or len(data) < HEADER_SIZE:
             return None
         
-        # configId: bytes 0-3
-        config_id = bytes_to_uint32_be(data[0:4])
-        
-        # msgId: bytes 4-7
-        msg_id = bytes_to_uint32_be(data[4:8])
-        
-        # userId: bytes 8-15
-        user_id = data[8:16]
-        
-        # funCode: byte 16
-        fun_code = data[16] & 0xFF
-        
-        # sourceId: byte 17 (value is stored shifted left by 4)
-        source_id = data[17] & 0xFF
-        
-        # pageIndex: byte 18
-        page_index = data[18] & 0xFF
-        
-        # dataLength: bytes 22-23
-        data_length = bytes_to_uint16_be(data[22], data[23])
+        # sourceId lives in the upper 4 bits of byte 17 (mirrors to_bytes)
+        (config_id, msg_id, user_id, fun_code,
+         source_byte, page_index, data_length) = _HDR.unpack_from(data, 0)
         
         return cls(
             config_id=config_id,
             msg_id=msg_id,
             user_id=user_id,
             fun_code=fun_code,
-            source_id=source_id,
+            source_id=source_byte >> 4,
             page_index=page_index,
             data_length=data_length
         )
@@ -264,41 +254,25 @@ class MsgHeader:
         Serialize header to byte array
         Equivalent to MqttUtils.b(Lcom/lucky/mqttlib/bean/MsgHeaderBean)[B
         """
-        result = bytearray(HEADER_SIZE)
-        
-        # configId: bytes 0-3
-        result[0:4] = int32_to_bytes_be(self.config_id)
-        
-        # msgId: bytes 4-7 (typically 0 for outgoing)
-        result[4:8] = int32_to_bytes_be(self.msg_id)
-        
-        # userId: bytes 8-15
         user_bytes = self.user_id if isinstance(self.user_id, bytes) else bytes(8)
-        result[8:16] = user_bytes[:8].ljust(8, b'\x00')
-        
-        # funCode: byte 16
-        result[16] = self.fun_code & 0xFF
-        
-        # sourceId: byte 17 (shifted left by 4)
-        result[17] = (self.source_id << 4) & 0xFF
-        
-        # pageIndex: byte 18
-        result[18] = self.page_index & 0xFF
-        
-        # reserved: bytes 19-21
-        result[19:22] = b'\x00\x00\x00'
         
-        # dataLength: bytes 22-23
-        result[22:24] = int16_to_bytes_be(self.data_length)
-        
-        return bytes(result)
+        # sourceId is stored shifted left by 4; reserved bytes 19-21 are zero
+        return _HDR.pack(
+            self.config_id & 0xFFFFFFFF,
+            self.msg_id & 0xFFFFFFFF,
+            user_bytes[:8],
+            self.fun_code & 0xFF,
+            (self.source_id << 4) & 0xFF,
+            self.page_index & 0xFF,
+            self.data_length & 0xFFFF,
+        )
 
 
 # =============================================================================
 # PARAMETER SEGMENT (from ParamSegmentBean.smali)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParamSegment:
     """
     Parameter segment within telemetry payload
@@ -309,18 +283,35 @@ class ParamSegment:
     segment_type: int = 0
     segment_address: int = 0  # Starting register address
     params_num: int = 0       # Number of parameters (registers)
-    values: bytes = field(default_factory=bytes)  # Raw register values
+    # Raw register values; a zero-copy view into the payload when parsed
+    values: Union[bytes, memoryview] = b""
     
-    def get_register_value(self, offset: int, length: int = 2) -> bytes:
+    def get_register_value(self, offset: int, length: int = 2) -> Union[bytes, memoryview]:
         """Get raw bytes for a register at offset"""
         start = offset * 2
         end = start + length
         if end <= len(self.values):
             return self.values[start:end]
         return bytes(length)
+    
+    def decode_u16(self) -> tuple:
+        """Decode every register as unsigned 16-bit in one call"""
+        n = len(self.values) // 2
+        unpacker = _U16_STRUCTS.get(n)
+        if unpacker is None:
+            unpacker = _U16_STRUCTS[n] = struct.Struct(f'>{n}H')
+        return unpacker.unpack_from(self.values)
+    
+    def decode_i16(self) -> tuple:
+        """Decode every register as signed 16-bit in one call"""
+        n = len(self.values) // 2
+        unpacker = _I16_STRUCTS.get(n)
+        if unpacker is None:
+            unpacker = _I16_STRUCTS[n] = struct.Struct(f'>{n}h')
+        return unpacker.unpack_from(self.values)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamsListBean:
     """
     Container for all parameter segments
@@ -334,7 +325,7 @@ class ParamsListBean:
 # KEY VALUE DTO (from KeyValueDTO.smali)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class KeyValueDTO:
     """
     Data transfer object for a single parameter/register
@@ -348,10 +339,10 @@ class KeyValueDTO:
     address_array: List[int] = field(default_factory=list)  # Register addresses
     data_length: int = 2             # 1=2bytes, 2=4bytes, 3=special
     data_type: str = "signed"        # "signed" or "unsigned"
-    coefficient: Decimal = field(default_factory=lambda: Decimal("1"))  # Multiplier
+    coefficient: Decimal = Decimal("1")  # Multiplier
     byte_truncate: int = 0           # Special parsing mode
     segment_id: int = 0              # Which segment this belongs to
-    data_bytes: bytes = field(default_factory=bytes)  # Raw bytes
+    data_bytes: bytes = b""  # Raw bytes
 
 
 # =============================================================================
@@ -360,7 +351,7 @@ class KeyValueDTO:
 # =============================================================================
 
 # Energy flow display keys (used for main dashboard)
-ENERGY_FLOW_KEYS_SINGLE_PHASE = [
+ENERGY_FLOW_KEYS_SINGLE_PHASE = (
     "energyFlowChartLineSegmentMarkerApp", "battNum", "onOffGridMode",
     "antiBackflowPowerPercentage", "systemRunMode", "batteryStatus",
     "battTotalSoc", "ct2Power", "pv1Power", "pv2Power",
@@ -369,16 +360,16 @@ ENERGY_FLOW_KEYS_SINGLE_PHASE = [
     "batteryPower", "status", "systemRunStatus", "ratedPower",
     "dailyEnergyGeneration", "energyFlowPvTotalPower", "energyFlowBattPower",
     "energyFlowGridPower", "energyFlowLoadTotalPower"
-]
+)
 
-ENERGY_FLOW_KEYS_THREE_PHASE = [
+ENERGY_FLOW_KEYS_THREE_PHASE = (
     "energyFlowLoadTotalPower", "bmsOnlineNumber", "onOffGridMode",
     "antiBackflowPowerPercentage", "systemRunMode", "batteryStatus",
     "battTotalSoc", "pv1Power", "pv2Power", "energyFlowDiagramLineFlag1",
     "energyFlowDiagramLineFlag2", "systemRunStatus", "outputRatedPower",
     "dailyEnergyGeneration", "energyFlowPvTotalPower", "totalPowerOfBatteryInFlow",
     "totalPowerOfGridInFlow"
-]
+)
 
 # Complete parameter definitions grouped by category
 # Format: {key: {"address": [addresses], "length": data_length, "type": data_type, "coeff": coefficient, "unit": unit}}
@@ -400,53 +391,53 @@ REGISTER_DEFINITIONS = {
     # =========================================================================
     "dcdcTemperature": {"length": 1, "type": "signed", "unit": "°C"},
     "countryCode": {"length": 1, "type": "unsigned"},
-    "busVoltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "dailyEnergyGeneration": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalEnergyGeneration": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
+    "busVoltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "dailyEnergyGeneration": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalEnergyGeneration": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
     "ratedPower": {"length": 1, "type": "unsigned", "unit": "W"},
     "battCapacity": {"length": 1, "type": "unsigned", "unit": "Ah"},
     
     # =========================================================================
     # PV INFORMATION
     # =========================================================================
-    "pv1voltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "pv1current": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
+    "pv1voltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "pv1current": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
     "pv1Power": {"length": 1, "type": "unsigned", "unit": "W"},
-    "pv2voltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "pv2current": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
+    "pv2voltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "pv2current": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
     "pv2Power": {"length": 1, "type": "unsigned", "unit": "W"},
-    "pvIsoVoltage": {"length": 1, "type": "unsigned", "coeff": "0.001", "unit": "MΩ"},
+    "pvIsoVoltage": {"length": 1, "type": "unsigned", "coeff": 0.001, "unit": "MΩ"},
     
     # =========================================================================
     # BATTERY INFORMATION
     # =========================================================================
     "batteryStatus": {"length": 1, "type": "unsigned"},
-    "batteryVoltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "batteryCurrent": {"length": 1, "type": "signed", "coeff": "0.1", "unit": "A"},
+    "batteryVoltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "batteryCurrent": {"length": 1, "type": "signed", "coeff": 0.1, "unit": "A"},
     "batteryPower": {"length": 1, "type": "signed", "unit": "W"},
     "battTotalSoc": {"length": 1, "type": "unsigned", "unit": "%"},
     "batterySoc": {"length": 1, "type": "unsigned", "unit": "%"},
     "battSign": {"length": 1, "type": "unsigned"},
-    "battChgVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
+    "battChgVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
     "battNum": {"length": 1, "type": "unsigned"},
-    "battEnergy": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "battCellVoltMax": {"length": 1, "type": "unsigned", "coeff": "0.001", "unit": "V"},
-    "battCellVoltMin": {"length": 1, "type": "unsigned", "coeff": "0.001", "unit": "V"},
+    "battEnergy": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "battCellVoltMax": {"length": 1, "type": "unsigned", "coeff": 0.001, "unit": "V"},
+    "battCellVoltMin": {"length": 1, "type": "unsigned", "coeff": 0.001, "unit": "V"},
     "battWorkState": {"length": 1, "type": "unsigned"},
     
     # =========================================================================
     # GRID INFORMATION
     # =========================================================================
     "gridStatus": {"length": 1, "type": "unsigned"},
-    "gridFreq": {"length": 1, "type": "unsigned", "coeff": "0.01", "unit": "Hz"},
-    "gridVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "sampleGridVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
+    "gridFreq": {"length": 1, "type": "unsigned", "coeff": 0.01, "unit": "Hz"},
+    "gridVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "sampleGridVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
     "gridApparentPower": {"length": 1, "type": "signed", "unit": "VA"},
     "gridActivePower": {"length": 1, "type": "signed", "unit": "W"},
     "gridReactivePower": {"length": 1, "type": "signed", "unit": "var"},
-    "ct1Curr": {"length": 1, "type": "signed", "coeff": "0.1", "unit": "A"},
+    "ct1Curr": {"length": 1, "type": "signed", "coeff": 0.1, "unit": "A"},
     "ct1Power": {"length": 1, "type": "signed", "unit": "W"},
-    "ct2Curr": {"length": 1, "type": "signed", "coeff": "0.1", "unit": "A"},
+    "ct2Curr": {"length": 1, "type": "signed", "coeff": 0.1, "unit": "A"},
     "ct2Power": {"length": 1, "type": "signed", "unit": "W"},
     "onOffGridMode": {"length": 1, "type": "unsigned"},
     
@@ -455,9 +446,9 @@ REGISTER_DEFINITIONS = {
     # =========================================================================
     "invTemperature": {"length": 1, "type": "signed", "unit": "°C"},
     "invStatus": {"length": 1, "type": "unsigned"},
-    "invOutputFreq": {"length": 1, "type": "unsigned", "coeff": "0.01", "unit": "Hz"},
-    "invOutputVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "invOutputCurr": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
+    "invOutputFreq": {"length": 1, "type": "unsigned", "coeff": 0.01, "unit": "Hz"},
+    "invOutputVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "invOutputCurr": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
     "invApparentPower": {"length": 1, "type": "signed", "unit": "VA"},
     "invActivePower": {"length": 1, "type": "signed", "unit": "W"},
     "invReactivePower": {"length": 1, "type": "signed", "unit": "var"},
@@ -482,8 +473,8 @@ REGISTER_DEFINITIONS = {
     # =========================================================================
     # LOAD INFORMATION
     # =========================================================================
-    "loadVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "loadCurr": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
+    "loadVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "loadCurr": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
     "loadActivePower": {"length": 1, "type": "signed", "unit": "W"},
     "loadRealTimePower": {"length": 1, "type": "signed", "unit": "W"},
     "loadPowerPercentage": {"length": 1, "type": "unsigned", "unit": "%"},
@@ -492,20 +483,20 @@ REGISTER_DEFINITIONS = {
     # =========================================================================
     # ENERGY STATISTICS
     # =========================================================================
-    "dailyPowerConsumption": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalEconsumption": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "dailyGridConnectionPower": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalOnGridElecGenerated": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "dailyOnGridElecConsumption": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalOnGridElecConsumption": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "dailyBattChargeEnergy": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalBattChargeEnergy": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "dailyBattDischargeEnergy": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalBattDischargeEnergy": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "dailySelfSufficientElec": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalSelfSufficientElec": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "dailySelfUseElec": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
-    "totalSelfUseElec": {"length": 2, "type": "unsigned", "coeff": "0.1", "unit": "kWh"},
+    "dailyPowerConsumption": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalEconsumption": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "dailyGridConnectionPower": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalOnGridElecGenerated": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "dailyOnGridElecConsumption": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalOnGridElecConsumption": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "dailyBattChargeEnergy": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalBattChargeEnergy": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "dailyBattDischargeEnergy": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalBattDischargeEnergy": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "dailySelfSufficientElec": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalSelfSufficientElec": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "dailySelfUseElec": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
+    "totalSelfUseElec": {"length": 2, "type": "unsigned", "coeff": 0.1, "unit": "kWh"},
     "dailySelfSufficientElecPercentage": {"length": 1, "type": "unsigned", "unit": "%"},
     "dailySelfUseElecPercentage": {"length": 1, "type": "unsigned", "unit": "%"},
     
@@ -513,11 +504,11 @@ REGISTER_DEFINITIONS = {
     # SETTINGS (READABLE/WRITABLE)
     # =========================================================================
     "antiBackflowPowerPercentage": {"length": 1, "type": "unsigned", "unit": "%"},
-    "batteryChargingCurrent": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
-    "batteryDischargeCurrent": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
-    "batteryAverageChargeVoltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "batteryFloatChargeVoltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "batteryEod": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
+    "batteryChargingCurrent": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
+    "batteryDischargeCurrent": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
+    "batteryAverageChargeVoltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "batteryFloatChargeVoltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "batteryEod": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
     "batteryDod": {"length": 1, "type": "unsigned", "unit": "%"},
     "onGridSocLimit": {"length": 1, "type": "unsigned", "unit": "%"},
     "offGridSocLimit": {"length": 1, "type": "unsigned", "unit": "%"},
@@ -541,11 +532,11 @@ REGISTER_DEFINITIONS = {
     # =========================================================================
     "meterIdentifier": {"length": 1, "type": "unsigned"},
     "meterNormalSign": {"length": 1, "type": "unsigned"},
-    "meterVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
-    "meterCurr": {"length": 1, "type": "signed", "coeff": "0.001", "unit": "A"},
+    "meterVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
+    "meterCurr": {"length": 1, "type": "signed", "coeff": 0.001, "unit": "A"},
     "meterPower": {"length": 1, "type": "signed", "unit": "W"},
-    "meterPowerFactor": {"length": 1, "type": "unsigned", "coeff": "0.001"},
-    "meterFreq": {"length": 1, "type": "unsigned", "coeff": "0.01", "unit": "Hz"},
+    "meterPowerFactor": {"length": 1, "type": "unsigned", "coeff": 0.001},
+    "meterFreq": {"length": 1, "type": "unsigned", "coeff": 0.01, "unit": "Hz"},
     
     # =========================================================================
     # TEMPERATURE
@@ -561,40 +552,58 @@ REGISTER_DEFINITIONS = {
     # =========================================================================
     "bmsOnlineNumber": {"length": 1, "type": "unsigned"},
     "bmsCommStatus": {"length": 1, "type": "unsigned"},
-    "maxChgThreshold": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
-    "maxDhgThreshold": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "A"},
+    "maxChgThreshold": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
+    "maxDhgThreshold": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "A"},
     "soc": {"length": 1, "type": "unsigned", "unit": "%"},
     "soh": {"length": 1, "type": "unsigned", "unit": "%"},
     "highestTemperature": {"length": 1, "type": "signed", "unit": "°C"},
     "lowestTemperature": {"length": 1, "type": "signed", "unit": "°C"},
-    "maxCellVolt": {"length": 1, "type": "unsigned", "coeff": "0.001", "unit": "V"},
-    "minCellVolt": {"length": 1, "type": "unsigned", "coeff": "0.001", "unit": "V"},
+    "maxCellVolt": {"length": 1, "type": "unsigned", "coeff": 0.001, "unit": "V"},
+    "minCellVolt": {"length": 1, "type": "unsigned", "coeff": 0.001, "unit": "V"},
     
     # =========================================================================
     # GENERATOR
     # =========================================================================
     "generatorStatus": {"length": 1, "type": "unsigned"},
     "generatorMode": {"length": 1, "type": "unsigned"},
-    "generatorStartBattVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
+    "generatorStartBattVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
     "generatorStartBattSoc": {"length": 1, "type": "unsigned", "unit": "%"},
-    "generatorEndBattVolt": {"length": 1, "type": "unsigned", "coeff": "0.1", "unit": "V"},
+    "generatorEndBattVolt": {"length": 1, "type": "unsigned", "coeff": 0.1, "unit": "V"},
     "generatorEndBattSoc": {"length": 1, "type": "unsigned", "unit": "%"},
     "generatorRatePower": {"length": 1, "type": "unsigned", "unit": "W"},
     
     # =========================================================================
     # SPECIAL CELL VOLTAGE KEYS (use coefficient 0.05 with offset)
     # =========================================================================
-    "powerDownVoltage": {"length": 1, "type": "unsigned", "coeff": "0.05", "special": "cell_voltage"},
-    "cellOverDischargeProtection": {"length": 1, "type": "unsigned", "coeff": "0.05", "special": "cell_voltage"},
-    "cellOverDischargeAlarmVoltage": {"length": 1, "type": "unsigned", "coeff": "0.1", "special": "cell_voltage_alt"},
+    "powerDownVoltage": {"length": 1, "type": "unsigned", "coeff": 0.05, "special": "cell_voltage"},
+    "cellOverDischargeProtection": {"length": 1, "type": "unsigned", "coeff": 0.05, "special": "cell_voltage"},
+    "cellOverDischargeAlarmVoltage": {"length": 1, "type": "unsigned", "coeff": 0.1, "special": "cell_voltage_alt"},
 }
 
+# Read-only lookup table; freeze it so callers cannot mutate shared state
+REGISTER_DEFINITIONS = MappingProxyType({
+    key: MappingProxyType(definition)
+    for key, definition in REGISTER_DEFINITIONS.items()
+})
+
+# Flattened decode metadata per key: (is_signed, coefficient, unit), so the
+# decode path does one lookup instead of three nested dict lookups
+_REGISTER_DECODE: Dict[str, Tuple[bool, Union[float, int], str]] = {
+    key: (
+        definition.get("type", "signed") == "signed",
+        definition.get("coeff", 1),
+        definition.get("unit", ""),
+    )
+    for key, definition in REGISTER_DEFINITIONS.items()
+}
+_DEFAULT_DECODE = (True, 1, "")
+
 
 # =============================================================================
 # MQTT DEVICE INFO (from MqttDeviceInfoVo.smali)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MqttDeviceInfoVo:
     """
     Parsed telemetry data object
@@ -659,21 +668,13 @@ class PayloadParser:
       - 2 bytes: segment_address (starting register)
       - 2 bytes: params_num (number of registers)
       - params_num * 2 bytes: register values
-    """
-    
-    def __init__(self):
-        self.position = 0
-        self.data = b''
     
-    def _read_uint16(self) -> int:
-        """Read 2-byte unsigned integer and advance position"""
-        if self.position + 2 > len(self.data):
-            return 0
-        value = bytes_to_uint16_be(self.data[self.position], self.data[self.position + 1])
-        self.position += 2
-        return value
+    Stateless: the read cursor is local, so one instance can be shared
+    between parsers and threads.
+    """
     
-    def parse_params_list(self, data: bytes) -> ParamsListBean:
+    @staticmethod
+    def parse_params_list(data: bytes) -> ParamsListBean:
         """
         Parse telemetry payload into ParamsListBean
         Equivalent to MqttUtils.l([B)Lcom/lucky/mqttlib/bean/ParamsListBean
@@ -681,36 +682,87 @@ class PayloadParser:
         if not data:
             return ParamsListBean()
         
-        self.data = data
-        self.position = 0
+        # Segment values are sliced from a read-only view, not copied
+        view = memoryview(data).toreadonly()
+        size = len(view)
         
         result = ParamsListBean()
         
         # Read segment count
-        result.segment_count = self._read_uint16()
+        result.segment_count = _U16.unpack_from(view)[0] if size >= 2 else 0
+        pos = 2
         
         # Parse each segment
         for _ in range(result.segment_count):
-            if self.position + 8 > len(self.data):
+            if pos + 8 > size:
                 break
             
             segment = ParamSegment()
-            segment.segment_id = self._read_uint16()
-            segment.segment_type = self._read_uint16()
-            segment.segment_address = self._read_uint16()
-            segment.params_num = self._read_uint16()
+            (segment.segment_id, segment.segment_type,
+             segment.segment_address, segment.params_num) = _SEG_HDR.unpack_from(view, pos)
+            pos += 8
             
             # Read register values
             value_bytes = segment.params_num * 2
-            if self.position + value_bytes <= len(self.data):
-                segment.values = self.data[self.position:self.position + value_bytes]
-                self.position += value_bytes
+            if pos + value_bytes <= size:
+                segment.values = view[pos:pos + value_bytes]
+                pos += value_bytes
             
             result.segments.append(segment)
         
         return result
 
 
+@lru_cache(maxsize=64, typed=True)
+def _coefficient_decimal(coefficient: Union[str, float, int]) -> Decimal:
+    """
+    Convert a str/float coefficient (e.g. from REGISTER_DEFINITIONS) to Decimal
+    
+    Goes through str() so 0.1 becomes Decimal("0.1"), not its binary expansion.
+    Only a handful of distinct coefficients exist, so results are cached.
+    """
+    return Decimal(str(coefficient))
+
+
+@lru_cache(maxsize=64)
+def _coefficient_scale(coefficient: str) -> Optional[Tuple[int, int]]:
+    """
+    Split a coefficient string into (integer multiplier, decimal places)
+    
+    e.g. "0.1" -> (1, 1), "0.01" -> (1, 2), "1" -> (1, 0), "1.0" -> (10, 1).
+    Keyed on str() rather than the value since Decimal("1.0") == Decimal("1")
+    but prints differently. Returns None where str(Decimal) would not print
+    plain notation (positive exponents, very small scales, NaN/Infinity).
+    """
+    sign, digits, exponent = Decimal(coefficient).as_tuple()
+    if not isinstance(exponent, int) or not -6 <= exponent <= 0:
+        return None
+    multiplier = int("".join(map(str, digits)))
+    return (-multiplier if sign else multiplier), -exponent
+
+
+def _scale_to_str(raw_value: int, coefficient: Union[Decimal, str, float, int]) -> str:
+    """
+    Format raw_value * coefficient exactly as str(Decimal(raw) * coefficient)
+    
+    Uses integer arithmetic for the usual 1 / 0.1 / 0.01 / 0.001 coefficients
+    and only falls back to Decimal for unusual ones.
+    """
+    scale = _coefficient_scale(str(coefficient))
+    if scale is None:
+        if not isinstance(coefficient, Decimal):
+            coefficient = _coefficient_decimal(coefficient)
+        return str(Decimal(raw_value) * coefficient)
+    multiplier, places = scale
+    # Decimal keeps the sign of zero products, e.g. 0 * -0.1 == "-0.0"
+    sign = "-" if (raw_value < 0) != (multiplier < 0) else ""
+    value = abs(raw_value * multiplier)
+    if not places:
+        return f"{sign}{value}"
+    whole, frac = divmod(value, 10 ** places)
+    return f"{sign}{whole}.{frac:0{places}d}"
+
+
 class ValueParser:
     """
     Parser for individual register values
@@ -744,43 +796,32 @@ class ValueParser:
         return "0"
     
     @staticmethod
-    def _parse_single_register(data: bytes, coefficient: Decimal, data_type: str, byte_truncate: int) -> str:
+    def _parse_single_register(data: bytes, coefficient: Union[Decimal, str, float, int], data_type: str, byte_truncate: int) -> str:
         """Parse single register (2 bytes)"""
         if len(data) < 2:
             return "0"
         
-        high_byte = data[0] & 0xFF
-        low_byte = data[1] & 0xFF
-        
         # Handle byte truncation modes
         if byte_truncate == ByteTruncate.HIGH_BYTE:
-            raw_value = high_byte
+            raw_value = data[0] & 0xFF
         elif byte_truncate == ByteTruncate.LOW_BYTE:
-            raw_value = low_byte
+            raw_value = data[1] & 0xFF
         else:
             # Full 16-bit value
-            if data_type == "signed":
-                raw_value = bytes_to_int16_be(high_byte, low_byte)
-            else:
-                raw_value = bytes_to_uint16_be(high_byte, low_byte)
+            raw_value = (_I16 if data_type == "signed" else _U16).unpack_from(data)[0]
         
         # Apply coefficient
-        result = Decimal(raw_value) * coefficient
-        return str(result)
+        return _scale_to_str(raw_value, coefficient)
     
     @staticmethod
-    def _parse_double_register(data: bytes, coefficient: Decimal, data_type: str) -> str:
+    def _parse_double_register(data: bytes, coefficient: Union[Decimal, str, float, int], data_type: str) -> str:
         """Parse double register (4 bytes / 32-bit)"""
         if len(data) < 4:
             return "0"
         
-        if data_type == "signed":
-            raw_value = bytes_to_int32_be(data[:4])
-        else:
-            raw_value = bytes_to_uint32_be(data[:4])
+        raw_value = (_I32 if data_type == "signed" else _U32).unpack_from(data)[0]
         
-        result = Decimal(raw_value) * coefficient
-        return str(result)
+        return _scale_to_str(raw_value, coefficient)
     
     @staticmethod
     def _parse_special_format(data: bytes, byte_truncate: int) -> str:
@@ -844,14 +885,17 @@ class ESYTelemetryParser:
         print(result.battery_power)
     """
     
-    def __init__(self, device_type: int = 1):
+    def __init__(self, device_type: int = 1, include_raw_registers: bool = True):
         """
         Initialize parser
         
         Args:
             device_type: 1 = single phase, 3 = three phase
+            include_raw_registers: store every register as reg_{address} in
+                all_values; disable when only segment info is needed
         """
         self.device_type = device_type
+        self.include_raw_registers = include_raw_registers
         self.payload_parser = PayloadParser()
         
         # Select appropriate key list based on device type
@@ -885,7 +929,8 @@ class ESYTelemetryParser:
         if payload_end > len(data):
             payload_end = len(data)
         
-        payload = data[payload_start:payload_end]
+        # Zero-copy: segment values end up as views into the original message
+        payload = memoryview(data)[payload_start:payload_end]
         
         # Parse payload
         return self.parse_payload(payload)
@@ -914,21 +959,12 @@ class ESYTelemetryParser:
     def _process_segment(self, segment: ParamSegment, result: MqttDeviceInfoVo):
         """Process a single segment and extract values"""
         base_address = segment.segment_address
+        all_values = result.all_values
         
-        # Iterate through register values
-        for i in range(segment.params_num):
-            register_address = base_address + i
-            
-            # Get 2-byte value at this position
-            offset = i * 2
-            if offset + 2 <= len(segment.values):
-                raw_bytes = segment.values[offset:offset + 2]
-                
-                # Parse as signed 16-bit by default
-                value = bytes_to_int16_be(raw_bytes[0], raw_bytes[1])
-                
-                # Store raw value by address
-                result.all_values[f"reg_{register_address}"] = value
+        # Parse as signed 16-bit by default and store raw value by address
+        if self.include_raw_registers:
+            values = segment.decode_i16()[:segment.params_num]
+            all_values.update(zip(_register_keys(base_address, len(values)), values))
         
         # Also store segment info
         result.all_values[f"segment_{segment.segment_id}_address"] = segment.segment_address
@@ -950,36 +986,26 @@ class ESYTelemetryParser:
         # Parse into segments
         params_list = self.payload_parser.parse_params_list(payload)
         
-        # Build address -> value lookup
+        # Build address -> unsigned value lookup, one bulk decode per segment
         address_values = {}
         for segment in params_list.segments:
-            for i in range(segment.params_num):
-                addr = segment.segment_address + i
-                offset = i * 2
-                if offset + 2 <= len(segment.values):
-                    address_values[addr] = segment.values[offset:offset + 2]
+            values = segment.decode_u16()[:segment.params_num]
+            base = segment.segment_address
+            address_values.update(zip(range(base, base + len(values)), values))
         
         # Map keys to values
         for key, address in key_mapping.items():
-            if address in address_values:
-                raw_bytes = address_values[address]
-                
+            raw_value = address_values.get(address)
+            if raw_value is not None:
                 # Get register definition if available
-                reg_def = REGISTER_DEFINITIONS.get(key, {})
-                data_type = reg_def.get("type", "signed")
-                coeff = Decimal(reg_def.get("coeff", "1"))
+                signed, coeff, unit = _REGISTER_DECODE.get(key, _DEFAULT_DECODE)
                 
                 # Parse value
-                if data_type == "signed":
-                    raw_value = bytes_to_int16_be(raw_bytes[0], raw_bytes[1])
-                else:
-                    raw_value = bytes_to_uint16_be(raw_bytes[0], raw_bytes[1])
+                if raw_value >= 0x8000 and signed:
+                    raw_value -= 0x10000
                 
-                # Apply coefficient
-                value = float(Decimal(raw_value) * coeff)
-                
-                # Store with unit if available
-                unit = reg_def.get("unit", "")
+                # Apply coefficient and store with unit if available
+                value = float(raw_value * coeff)
                 result[key] = {"value": value, "unit": unit, "raw": raw_value}
         
         return result
@@ -1017,12 +1043,39 @@ class ESYCommandBuilder:
         self.user_id_bytes = user_id_to_bytes(user_id)
         self.config_id = config_id
         self.msg_id_counter = 0
+        # Serialized headers with msgId/dataLength zeroed, keyed by
+        # (config_id, user_id_bytes, fun_code)
+        self._header_templates: Dict[Tuple[int, bytes, int], bytes] = {}
+        # Reused for every single-register write (header + address + value)
+        self._write_buffer = bytearray(HEADER_SIZE + _U16_PAIR.size)
     
     def _get_next_msg_id(self) -> int:
         """Get next message ID"""
         self.msg_id_counter += 1
         return self.msg_id_counter
     
+    def _write_header(self, message: bytearray, fun_code: int, data_length: int):
+        """
+        Write an app-sourced header for the next message ID into message
+        
+        Only msgId and dataLength change between commands, so the rest is
+        serialized once per template and patched in place.
+        """
+        template_key = (self.config_id, self.user_id_bytes, fun_code)
+        template = self._header_templates.get(template_key)
+        if template is None:
+            template = self._header_templates[template_key] = MsgHeader(
+                config_id=self.config_id,
+                user_id=self.user_id_bytes,
+                fun_code=fun_code,
+                source_id=0x02,  # App source
+                page_index=0,
+            ).to_bytes()
+        
+        message[:HEADER_SIZE] = template
+        _U32.pack_into(message, _MSG_ID_OFFSET, self._get_next_msg_id() & 0xFFFFFFFF)
+        _U16.pack_into(message, _DATA_LENGTH_OFFSET, data_length & 0xFFFF)
+    
     def build_write_command(self, register_address: int, value: int,
                            fun_code: int = FunctionCode.WRITE_SINGLE) -> bytes:
         """
@@ -1036,24 +1089,11 @@ class ESYCommandBuilder:
         Returns:
             Complete message bytes to publish
         """
-        # Build header
-        header = MsgHeader(
-            config_id=self.config_id,
-            msg_id=self._get_next_msg_id(),
-            user_id=self.user_id_bytes,
-            fun_code=fun_code,
-            source_id=0x02,  # App source
-            page_index=0,
-            data_length=4  # 2 bytes address + 2 bytes value
-        )
-        
-        # Build payload
-        payload = bytearray()
-        payload.extend(int16_to_bytes_be(register_address))
-        payload.extend(int16_to_bytes_be(value & 0xFFFF))
-        
-        # Combine
-        return header.to_bytes() + bytes(payload)
+        # Payload is 2 bytes address + 2 bytes value
+        message = self._write_buffer
+        self._write_header(message, fun_code, _U16_PAIR.size)
+        _U16_PAIR.pack_into(message, HEADER_SIZE, register_address & 0xFFFF, value & 0xFFFF)
+        return bytes(message)
     
     def build_multi_write_command(self, register_address: int, 
                                   values: List[int]) -> bytes:
@@ -1069,47 +1109,45 @@ class ESYCommandBuilder:
         """
         # Build header
         payload_length = 4 + len(values) * 2  # addr(2) + count(2) + values
-        
-        header = MsgHeader(
-            config_id=self.config_id,
-            msg_id=self._get_next_msg_id(),
-            user_id=self.user_id_bytes,
-            fun_code=FunctionCode.WRITE_MULTIPLE,
-            source_id=0x02,
-            page_index=0,
-            data_length=payload_length
+        message = bytearray(HEADER_SIZE + payload_length)
+        self._write_header(message, FunctionCode.WRITE_MULTIPLE, payload_length)
+        
+        # Build payload: address, count, then each value as u16
+        struct.pack_into(
+            f'>{len(values) + 2}H',
+            message,
+            HEADER_SIZE,
+            register_address & 0xFFFF,
+            len(values) & 0xFFFF,
+            *(val & 0xFFFF for val in values),
         )
         
-        # Build payload
-        payload = bytearray()
-        payload.extend(int16_to_bytes_be(register_address))
-        payload.extend(int16_to_bytes_be(len(values)))
-        for val in values:
-            payload.extend(int16_to_bytes_be(val & 0xFFFF))
-        
-        return header.to_bytes() + bytes(payload)
+        return bytes(message)
 
 
 # =============================================================================
 # MQTT CLIENT HELPER
 # =============================================================================
 
-def get_mqtt_topics(device_id: str) -> Dict[str, str]:
+@lru_cache(maxsize=128)
+def get_mqtt_topics(device_id: str) -> MappingProxyType:
     """
     Get MQTT topics for a device
     
+    Topics are cached per device and returned as a read-only mapping.
+    
     Args:
         device_id: Device ID string
         
     Returns:
-        Dict with 'up', 'down', 'alarm' topic strings
+        Mapping with 'up', 'down', 'alarm' topic strings
     """
-    return {
+    return MappingProxyType({
         'up': f'/ESY/PVVC/{device_id}/UP',
         'down': f'/ESY/PVVC/{device_id}/DOWN',
         'alarm': f'/ESY/PVVC/{device_id}/ALARM',
         'news': f'/APP/{device_id}/NEWS'  # Uses user_id typically
-    }
+    })
 
 
 # =============================================================================
@@ -0,0 +1,74 @@
+"""Tests for decoding segment registers through the protocol map.
+
+protocol.py is loaded via a synthetic package so its relative imports resolve
+without importing Home Assistant (the real package __init__ pulls in HA).
+"""
+
+import importlib
+import pathlib
+import struct
+import sys
+import types
+
+_PKG_DIR = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components" / "esy_sunhome"
+)
+if "esyx" not in sys.modules:
+    _pkg = types.ModuleType("esyx")
+    _pkg.__path__ = [str(_PKG_DIR)]
+    sys.modules["esyx"] = _pkg
+protocol = importlib.import_module("esyx.protocol")
+protocol_api = importlib.import_module("esyx.protocol_api")
+
+
+def _register(address, key, data_type="unsigned", coefficient=1, data_length=2):
+    return protocol_api.RegisterDefinition(
+        address=address,
+        data_key=key,
+        data_type=data_type,
+        coefficient=coefficient,
+        unit="",
+        data_length=data_length,
+        function_code=protocol.FC_READ_INPUT,
+    )
+
+
+def _build(registers, base, words):
+    proto = protocol_api.ProtocolDefinition(
+        config_id=1, pv_power=1, tp_type=1, mcu_version=1
+    )
+    for reg in registers:
+        proto.input_registers[reg.address] = reg
+    parser = protocol.DynamicTelemetryParser(proto)
+    segment = protocol.ParamSegment(
+        0, protocol.FC_READ_INPUT, base, len(words),
+        struct.pack(f">{len(words)}H", *words),
+    )
+    header = protocol.MsgHeader(1, 1, bytes(8), 0x20, 0x10, 0, 0)
+    return parser._build_telemetry_data([segment], header)
+
+
+def test_32bit_register_combines_high_and_low_words():
+    values = _build(
+        [
+            _register(10, "totalEnergyGeneration", coefficient=0.1, data_length=4),
+            _register(12, "batteryCurrent", "signed", 0.1),
+        ],
+        10,
+        [0x0001, 0x86A0, 0xFFF6],
+    )
+    assert values["totalEnergyGeneration"] == 10000.0  # 100000 * 0.1
+    assert values["totalPowerGeneration"] == 10000.0   # legacy alias
+    assert values["batteryCurrent"] == -1.0
+    # The low word belongs to the 32-bit register, not an unknown one
+    assert "_unknown_fc4_addr11" not in values
+
+
+def test_signed_32bit_register():
+    values = _build(
+        [_register(20, "meterEnergy", "signed", data_length=4)],
+        20,
+        [0xFFFF, 0xFFFE],
+    )
+    assert values["meterEnergy"] == -2